@@ -8,15 +8,21 @@ Async by default - spin returns immediately, check results later.
 Storage: ~/.spindle/spools/{spool_id}.json
 
 Subprocess handling: Uses detached processes that survive MCP reconnects.
-A background thread monitors completion by polling the PID.
+A single supervisor thread monitors completion by polling the PIDs.
 """
 
 import asyncio
+import concurrent.futures
 import fcntl
+import functools
+import heapq
+import io
 import json
 import logging
 import os
+import queue
 import re
+import select
 import shutil
 import signal
 import subprocess
@@ -24,15 +30,33 @@ import sys
 import threading
 import time
 import uuid
+from collections import Counter
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Generator
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Generator
+
+try:
+    from re import _constants as _sre_constants, _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
 
 from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+try:
+    import orjson  # Optional: faster spool (de)serialization, see the "fast" extra
+except ImportError:
+    orjson = None
+
+try:
+    import regex  # Optional: time-limited spool_grep matching, see the "fast" extra
+except ImportError:
+    regex = None
+
 mcp = FastMCP("spindle")
 
 # Set up logging
@@ -61,12 +85,67 @@ async def health_check(request: Request) -> JSONResponse:
 # Storage directory
 SPINDLE_DIR = Path.home() / ".spindle" / "spools"
 
+
+def _json_loads(data: str | bytes) -> Any:
+    """
+    Parse JSON with orjson when available.
+
+    Errors are json.JSONDecodeError, or UnicodeDecodeError for bytes that
+    aren't valid UTF-8 without orjson - catch ValueError to handle both.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(data: Any) -> bytes:
+    """Serialize a spool record to compact UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _json_text(data: Any) -> str:
+    """Serialize a tool result to indented JSON text, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 # Concurrency limit (configurable via env var)
 MAX_CONCURRENT = int(os.environ.get("SPINDLE_MAX_CONCURRENT", "15"))
 
 # Poll interval for monitoring detached processes
 MONITOR_POLL_INTERVAL = 2  # seconds
 
+# How long spin(wait=True) blocks for a free slot before giving up
+SPIN_WAIT_TIMEOUT = 600  # seconds
+
+# How often the supervisor thread removes spools older than 24 hours
+CLEANUP_INTERVAL = 3600  # seconds
+
+# bubblewrap binary for sandboxing shard spools, looked up once at startup
+_BWRAP_PATH = shutil.which("bwrap")
+
+# Home config dirs/files made writable inside shard sandboxes, if present
+_BWRAP_CONFIG_ITEMS = (".claude", ".claude.json", ".anthropic", ".spindle", ".config", ".cache")
+
+# --bind arguments for the existing paths of a path set, with when they were
+# checked: {paths: (checked_at, binds)}. These sets (a repo's shared git
+# dirs, the home config items) repeat across shard spins; entries are
+# redone after _BWRAP_BINDS_TTL seconds in case paths appear or vanish.
+_BWRAP_BINDS: Dict[tuple[str, ...], tuple[float, tuple[str, ...]]] = {}
+_BWRAP_BINDS_TTL = 60.0
+
+# Time windows accepted by spool_results(since=...)
+SINCE_WINDOWS = {
+    "1h": timedelta(hours=1),
+    "6h": timedelta(hours=6),
+    "12h": timedelta(hours=12),
+    "1d": timedelta(days=1),
+    "7d": timedelta(days=7),
+}
+
 # Permission profiles for tool restrictions
 # These map to Claude Code's --allowedTools flag
 # Profiles ending with "+shard" auto-enable shard isolation
@@ -79,45 +158,68 @@ PERMISSION_PROFILES = {
     "careful+shard": "Read,Write,Edit,Grep,Glob,Bash(git:*),Bash(make:*),Bash(pytest:*),Bash(python:*),Bash(npm:*),Bash(skein:*),Bash(muster:*)",
 }
 
-# Cache for SKEIN availability check (per-directory)
-_skein_available: Dict[str, bool] = {}
+# (allowed_tools, use_shard) for each profile, resolved once at import
+_RESOLVED_PROFILES = MappingProxyType({
+    name: (tools, name == "shard" or name.endswith("+shard"))
+    for name, tools in PERMISSION_PROFILES.items()
+})
+
+
+def _in_git_repo(path: Path) -> bool:
+    """Check for a .git entry in path or any parent, without running git."""
+    return any((p / ".git").exists() for p in (path, *path.parents))
+
+
+# Cache for SKEIN availability check, per directory: {dir: (checked_at, available)}.
+# Entries expire after _SKEIN_CACHE_TTL seconds so installing skein or
+# starting its server is noticed without restarting spindle.
+_skein_available: Dict[str, tuple[float, bool]] = {}
+_skein_lock = threading.Lock()
+_SKEIN_CACHE_TTL = 60.0
 
 
 def _has_skein(working_dir: str) -> bool:
     """
     Check if SKEIN is available for the given project directory.
-    Results are cached per-directory for performance.
+    Results are cached per-directory for _SKEIN_CACHE_TTL seconds.
 
     Uses 'skein health' which checks git repo, .skein/ dir, and server.
+    Concurrent callers share a single check instead of each running one.
 
     Args:
         working_dir: The directory to check for SKEIN availability
     """
-    global _skein_available
-
     # Normalize the path for consistent cache keys
     cache_key = str(Path(working_dir).resolve())
 
-    if cache_key in _skein_available:
-        return _skein_available[cache_key]
+    cached = _skein_available.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _SKEIN_CACHE_TTL:
+        return cached[1]
 
-    try:
-        result = subprocess.run(
-            ["skein", "health", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=working_dir,
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            _skein_available[cache_key] = data.get("healthy", False)
-        else:
-            _skein_available[cache_key] = False
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError, json.JSONDecodeError):
-        _skein_available[cache_key] = False
+    with _skein_lock:
+        # Another thread may have refreshed the entry while we waited
+        cached = _skein_available.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _SKEIN_CACHE_TTL:
+            return cached[1]
 
-    return _skein_available[cache_key]
+        available = False
+        # Cheap negatives first: no skein binary, or not inside a git repo
+        if shutil.which("skein") is not None and _in_git_repo(Path(cache_key)):
+            try:
+                result = subprocess.run(
+                    ["skein", "health", "--json"],
+                    capture_output=True,
+                    text=True,
+                    timeout=2,
+                    cwd=working_dir,
+                )
+                if result.returncode == 0:
+                    available = bool(json.loads(result.stdout).get("healthy", False))
+            except (subprocess.TimeoutExpired, FileNotFoundError, OSError, json.JSONDecodeError):
+                pass
+
+        _skein_available[cache_key] = (time.monotonic(), available)
+        return available
 
 
 def _resolve_permission(permission: Optional[str], allowed_tools: Optional[str]) -> tuple[Optional[str], bool]:
@@ -135,19 +237,8 @@ def _resolve_permission(permission: Optional[str], allowed_tools: Optional[str])
     if allowed_tools:
         return allowed_tools, False
 
-    # If no permission specified, use "careful" as default
-    if not permission:
-        permission = "careful"
-
-    # Check if this is a shard profile
-    use_shard = permission == "shard" or permission.endswith("+shard")
-
-    # Look up profile
-    if permission in PERMISSION_PROFILES:
-        return PERMISSION_PROFILES[permission], use_shard
-
-    # Unknown profile - use careful, no shard
-    return PERMISSION_PROFILES["careful"], False
+    # No permission means "careful"; unknown profiles fall back to it too
+    return _RESOLVED_PROFILES.get(permission or "careful", _RESOLVED_PROFILES["careful"])
 
 
 def _spawn_shard(agent_id: str, working_dir: str) -> Optional[Dict[str, str]]:
@@ -175,24 +266,22 @@ def _spawn_shard(agent_id: str, working_dir: str) -> Optional[Dict[str, str]]:
                 timeout=30,
             )
             if result.returncode == 0:
-                # Parse output to get worktree path
+                # Parse output to get worktree path, branch and shard id
                 # Output format: "✓ Spawned SHARD: ..."
+                worktree_path = branch_name = shard_id = None
                 for line in result.stdout.splitlines():
-                    if "Worktree:" in line:
-                        worktree_path = line.split("Worktree:")[1].strip()
-                        # Extract other info
-                        branch_name = None
-                        shard_id = None
-                        for l in result.stdout.splitlines():
-                            if "Branch:" in l:
-                                branch_name = l.split("Branch:")[1].strip()
-                            if "Spawned SHARD:" in l:
-                                shard_id = l.split("Spawned SHARD:")[1].strip()
-                        return {
-                            "worktree_path": worktree_path,
-                            "branch_name": branch_name or f"shard-{agent_id}",
-                            "shard_id": shard_id or agent_id,
-                        }
+                    if worktree_path is None and "Worktree:" in line:
+                        worktree_path = line.partition("Worktree:")[2].strip()
+                    if "Branch:" in line:
+                        branch_name = line.partition("Branch:")[2].strip()
+                    if "Spawned SHARD:" in line:
+                        shard_id = line.partition("Spawned SHARD:")[2].strip()
+                if worktree_path is not None:
+                    return {
+                        "worktree_path": worktree_path,
+                        "branch_name": branch_name or f"shard-{agent_id}",
+                        "shard_id": shard_id or agent_id,
+                    }
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             pass
 
@@ -247,66 +336,81 @@ def _close_tender_folios(worktree_name: str, working_dir: str) -> Optional[str]:
     if not _has_skein(working_dir):
         return None
 
-    try:
-        import urllib.request
-        import urllib.error
+    import http.client
+    from urllib.parse import urlsplit
 
+    try:
         # Query SKEIN for tender folios
-        skein_url = os.environ.get("SKEIN_URL", "http://localhost:8001")
+        skein_url = urlsplit(os.environ.get("SKEIN_URL", "http://localhost:8001"))
         agent_id = os.environ.get("SKEIN_AGENT_ID", "spindle")
+        base_path = skein_url.path.rstrip("/")
 
-        # Get all tender folios
-        req = urllib.request.Request(f"{skein_url}/folios?type=tender", headers={"X-Agent-ID": agent_id})
-
-        with urllib.request.urlopen(req, timeout=10) as response:
-            folios = json.loads(response.read().decode())
-
-        # Find tenders with matching worktree_name in metadata
-        closed_folios = []
-        for folio in folios:
-            metadata = folio.get("metadata", {})
-            if isinstance(metadata, str):
-                try:
-                    metadata = json.loads(metadata)
-                except json.JSONDecodeError:
-                    continue
-
-            if metadata.get("worktree_name") == worktree_name:
-                folio_id = folio.get("folio_id")
-                if not folio_id:
-                    continue
+        # One keep-alive connection serves the query and every close below
+        conn_cls = http.client.HTTPSConnection if skein_url.scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(skein_url.netloc, timeout=10)
+        try:
+            # Get all tender folios
+            conn.request("GET", f"{base_path}/folios?type=tender", headers={"X-Agent-ID": agent_id})
+            response = conn.getresponse()
+            body = response.read()
+            if response.status >= 400:
+                return None
+            folios = json.loads(body.decode())
+
+            # Find tenders with matching worktree_name in metadata
+            closed_folios = []
+            for folio in folios:
+                metadata = folio.get("metadata", {})
+                if isinstance(metadata, str):
+                    try:
+                        metadata = json.loads(metadata)
+                    except json.JSONDecodeError:
+                        continue
 
-                # Check if already closed
-                status = folio.get("status", "open")
-                if status == "closed":
-                    continue
+                if metadata.get("worktree_name") == worktree_name:
+                    folio_id = folio.get("folio_id")
+                    if not folio_id:
+                        continue
 
-                # Close the folio by creating a status thread
-                close_data = json.dumps(
-                    {"from_id": folio_id, "to_id": folio_id, "type": "status", "content": "closed"}
-                ).encode()
+                    # Check if already closed
+                    status = folio.get("status", "open")
+                    if status == "closed":
+                        continue
 
-                close_req = urllib.request.Request(
-                    f"{skein_url}/threads",
-                    data=close_data,
-                    headers={"X-Agent-ID": agent_id, "Content-Type": "application/json"},
-                    method="POST",
-                )
+                    # Close the folio by creating a status thread
+                    close_data = json.dumps(
+                        {"from_id": folio_id, "to_id": folio_id, "type": "status", "content": "closed"}
+                    ).encode()
 
-                try:
-                    urllib.request.urlopen(close_req, timeout=10)
-                    closed_folios.append(folio_id)
-                except urllib.error.URLError:
-                    pass  # Ignore individual close failures
+                    try:
+                        conn.request(
+                            "POST",
+                            f"{base_path}/threads",
+                            body=close_data,
+                            headers={"X-Agent-ID": agent_id, "Content-Type": "application/json"},
+                        )
+                        response = conn.getresponse()
+                        response.read()
+                        if response.status < 400:
+                            closed_folios.append(folio_id)
+                    except (http.client.HTTPException, OSError):
+                        # Ignore individual close failures; the next request reconnects
+                        conn.close()
+        finally:
+            conn.close()
 
         if closed_folios:
             return f"Closed tender(s): {', '.join(closed_folios)}"
         return None
 
-    except (urllib.error.URLError, OSError, json.JSONDecodeError):
+    except (http.client.HTTPException, OSError, ValueError):
         return None  # SKEIN not available or error, continue silently
 
 
+# Background workers for worktree removal that no caller waits on
+_CLEANUP_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="spindle-cleanup")
+
+
 def _cleanup_shard(shard_info: Dict[str, str], working_dir: str, keep_branch: bool = False, spool_id: Optional[str] = None) -> bool:
     """
     Clean up a SHARD worktree.
@@ -345,20 +449,7 @@ def _cleanup_shard(shard_info: Dict[str, str], working_dir: str, keep_branch: bo
 
         # Optionally delete branch
         if not keep_branch and branch_name:
-            result = subprocess.run(
-                ["git", "branch", "-D", branch_name],
-                capture_output=True,
-                text=True,
-                cwd=working_dir,
-                timeout=10
-            )
-            if result.returncode != 0:
-                logger.warning(
-                    f"Failed to delete branch {branch_name}" +
-                    (f" for spool {spool_id}" if spool_id else "") +
-                    f": {result.stderr.strip()}"
-                )
-                # Don't return False here - worktree removal succeeded
+            _delete_shard_branch(branch_name, working_dir, spool_id)
 
         # Prune worktree references
         result = subprocess.run(
@@ -393,6 +484,33 @@ def _cleanup_shard(shard_info: Dict[str, str], working_dir: str, keep_branch: bo
         return False
 
 
+def _delete_shard_branch(branch_name: str, working_dir: str, spool_id: Optional[str] = None) -> bool:
+    """
+    Delete a SHARD branch once its worktree is gone. Failures are logged.
+
+    Returns:
+        True if the branch was deleted
+    """
+    try:
+        result = subprocess.run(
+            ["git", "branch", "-D", branch_name],
+            capture_output=True,
+            text=True,
+            cwd=working_dir,
+            timeout=10
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+        result = subprocess.CompletedProcess([], 1, "", str(e))
+    if result.returncode != 0:
+        logger.warning(
+            f"Failed to delete branch {branch_name}" +
+            (f" for spool {spool_id}" if spool_id else "") +
+            f": {result.stderr.strip()}"
+        )
+        return False
+    return True
+
+
 def _get_spool_path(spool_id: str) -> Path:
     """Get path to spool JSON file."""
     return SPINDLE_DIR / f"{spool_id}.json"
@@ -413,31 +531,106 @@ def _get_transcript_path(spool_id: str) -> Path:
     return SPINDLE_DIR / "transcripts" / f"{spool_id}.txt"
 
 
+# Read cache for _list_spools: {spindle_dir: {spool_id: {"stamp": ..., "spool": ...}}}.
+# The JSON files stay the source of truth; entries are revalidated by stat.
+# Per-directory dicts are updated in place under _INDEX_LOCK, so anything
+# iterating one takes a copy under the lock (see _refresh_spool_index).
+_SPOOL_INDEX: Dict[str, Dict[str, dict]] = {}
+_INDEX_LOCK = threading.Lock()
+
+# (inode, mtime_ns) of each SPINDLE_DIR as of its last full scan, recorded
+# only when that scan can be trusted to have seen every change up to that
+# mtime (see _refresh_spool_index)
+_INDEX_DIR_STAMPS: Dict[str, tuple[int, int]] = {}
+
+# Directory mtimes are only as fine-grained as the filesystem clock, so a
+# change landing in the same tick as a scan may not move the mtime. A scan
+# only vouches for the directory once its mtime is this far in the past.
+_INDEX_RACY_WINDOW_NS = 2_000_000_000
+
+# Cold index loads (first scan, or many spools changed at once) read their
+# files on this pool so the open/read latency overlaps
+_INDEX_READ_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="spindle-index")
+
+# Fewer changed files than this are read inline; a pool round trip isn't
+# worth it for the usual one or two
+_INDEX_PARALLEL_MIN = 32
+
+
 def _write_spool(spool_id: str, data: dict) -> None:
     """Atomically write spool data to disk."""
-    SPINDLE_DIR.mkdir(parents=True, exist_ok=True)
     path = _get_spool_path(spool_id)
     tmp_path = path.with_suffix(".tmp")
 
-    with open(tmp_path, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = _json_dumps_bytes(data)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC
 
-    os.rename(tmp_path, path)
+    # The directory almost always exists; only pay for mkdir when it doesn't
+    try:
+        fd = os.open(tmp_path, flags, 0o644)
+    except FileNotFoundError:
+        SPINDLE_DIR.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, flags, 0o644)
+
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        # replace keeps the inode and mtime, so this is the final file's stamp
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(tmp_path, path)
+
+    # Write-through: the next listing sees this record without re-reading it.
+    # A shallow copy keeps later in-place edits by the caller out of the index.
+    entry = {"stamp": (st.st_ino, st.st_mtime_ns, st.st_size), "spool": dict(data)}
+    with _INDEX_LOCK:
+        _SPOOL_INDEX.setdefault(str(SPINDLE_DIR), {})[spool_id] = entry
+
+    if data.get("status") not in ("running", "pending"):
+        _notify_slot_freed()
+        _notify_spool_done(spool_id)
 
 
 def _read_spool(spool_id: str) -> Optional[dict]:
-    """Read spool data from disk."""
+    """
+    Read spool data from disk.
+
+    A file unchanged since it was indexed (written by _write_spool or parsed
+    by _refresh_spool_index) is served from the index instead of re-parsed.
+    The returned dict is a shallow copy: replace nested values rather than
+    editing them in place.
+    """
     path = _get_spool_path(spool_id)
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except OSError:
         return None
-
+    entry = _SPOOL_INDEX.get(str(SPINDLE_DIR), {}).get(spool_id)
+    if entry is not None and entry["stamp"] == (st.st_ino, st.st_mtime_ns, st.st_size):
+        return dict(entry["spool"])
     try:
-        with open(path) as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
     except (json.JSONDecodeError, IOError):
         return None
 
 
+def _read_text(path: Path) -> str:
+    """Read a text file, returning "" if it is missing or unreadable."""
+    try:
+        return path.read_text()
+    except IOError:
+        return ""
+
+
+def _parse_tags(tags: Optional[str]) -> list[str]:
+    """Split a comma-separated tags argument into a list of stripped tags."""
+    return [t.strip() for t in tags.split(",")] if tags else []
+
+
 def _get_lock_path(spool_id: str) -> Path:
     """Get path to lock file for a spool."""
     return SPINDLE_DIR / f"{spool_id}.lock"
@@ -484,19 +677,149 @@ def _spool_lock(spool_id: str, blocking: bool = True) -> Generator[bool, None, N
             os.close(lock_fd)
 
 
+def _load_index_entry(path: str, stamp: tuple) -> Optional[dict]:
+    """Parse a spool file into an index entry, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return {"stamp": stamp, "spool": _json_loads(f.read())}
+    except Exception:
+        return None
+
+
+def _refresh_spool_index() -> Dict[str, dict]:
+    """
+    Bring the index up to date with SPINDLE_DIR.
+
+    Returns a snapshot {spool_id: {"stamp": ..., "spool": ...}} for all
+    spool files, safe to iterate while writes carry on.
+
+    Parsed spools are cached in _SPOOL_INDEX and only re-read when the file's
+    (inode, mtime, size) changes. Spool files are replaced via rename, so any
+    write - from this process or another one sharing SPINDLE_DIR - shows up
+    as a new inode. When many files need reading at once (a cold start, say),
+    they are read on _INDEX_READ_POOL.
+
+    Renames and deletions also bump the directory's mtime, so while that is
+    unchanged since a trusted scan, the cached index is returned without
+    listing the directory at all.
+    """
+    dir_key = str(SPINDLE_DIR)
+    try:
+        dir_st = os.stat(SPINDLE_DIR)
+    except OSError:
+        return {}
+    dir_stamp = (dir_st.st_ino, dir_st.st_mtime_ns)
+
+    with _INDEX_LOCK:
+        cached = dict(_SPOOL_INDEX.get(dir_key, {}))
+        if _INDEX_DIR_STAMPS.get(dir_key) == dir_stamp:
+            return cached
+
+    scan_started_ns = time.time_ns()
+    fresh: Dict[str, dict] = {}
+    changed: list[tuple[str, str, tuple]] = []
+    try:
+        it = os.scandir(SPINDLE_DIR)
+    except OSError:
+        return {}
+    with it:
+        for dirent in it:
+            name = dirent.name
+            if not name.endswith(".json"):
+                continue
+            try:
+                st = dirent.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            spool_id = name[:-5]
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+            entry = cached.get(spool_id)
+            if entry is None or entry["stamp"] != stamp:
+                changed.append((spool_id, dirent.path, stamp))
+            else:
+                fresh[spool_id] = entry
+
+    if len(changed) >= _INDEX_PARALLEL_MIN:
+        loaded = _INDEX_READ_POOL.map(lambda c: _load_index_entry(c[1], c[2]), changed)
+    else:
+        loaded = (_load_index_entry(path, stamp) for _, path, stamp in changed)
+    complete = True
+    for (spool_id, _, _), entry in zip(changed, loaded):
+        if entry is None:
+            complete = False  # Retry on the next refresh
+        else:
+            fresh[spool_id] = entry
+
+    # Swap in the new index; entries for deleted files drop out here. The
+    # caller keeps its own copy, since writes update the index in place.
+    with _INDEX_LOCK:
+        _SPOOL_INDEX[dir_key] = dict(fresh)
+        if complete and dir_stamp[1] < scan_started_ns - _INDEX_RACY_WINDOW_NS:
+            _INDEX_DIR_STAMPS[dir_key] = dir_stamp
+        else:
+            _INDEX_DIR_STAMPS.pop(dir_key, None)
+    return fresh
+
+
+def _list_spool_entries() -> list[dict]:
+    """List index entries ({"stamp": ..., "spool": ...}) for all spool files."""
+    return list(_refresh_spool_index().values())
+
+
 def _list_spools() -> list[dict]:
-    """List all spool files."""
-    if not SPINDLE_DIR.exists():
-        return []
+    """
+    List all spool files.
 
-    spools = []
-    for path in SPINDLE_DIR.glob("*.json"):
-        try:
-            with open(path) as f:
-                spools.append(json.load(f))
-        except Exception:
-            pass
-    return spools
+    The returned dicts are shared with the index cache: treat them as read-only.
+    """
+    return [entry["spool"] for entry in _list_spool_entries()]
+
+
+def _spool_text(entry: dict, field: str) -> tuple[str, str]:
+    """
+    Get (text, lowercased text) for a spool's prompt or result.
+
+    Dict results are serialized to JSON. Memoized on the index entry, so it
+    is recomputed only when the spool file changes.
+    """
+    memo = entry.setdefault("text", {})
+    if field not in memo:
+        value = entry["spool"].get(field, "") or ""
+        if isinstance(value, dict):
+            value = json.dumps(value)
+        memo[field] = (value, value.lower())
+    return memo[field]
+
+
+def _text_leaves(value: Any) -> Generator[str, None, None]:
+    """Yield the keys, strings and numbers inside a JSON value, depth first."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield key
+            yield from _text_leaves(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _text_leaves(item)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield str(value)
+
+
+def _grep_text(entry: dict) -> tuple[tuple[str, ...], str]:
+    """
+    Get (texts, folded text) of a spool's result for spool_grep.
+
+    Dict results are searched leaf by leaf rather than as serialized JSON,
+    so patterns don't match quoting or escapes. Memoized on the index entry
+    alongside _spool_text, so unchanged spools aren't walked or re-folded.
+    """
+    memo = entry.setdefault("text", {})
+    if "grep" not in memo:
+        result = entry["spool"].get("result") or ""
+        texts = tuple(_text_leaves(result))
+        memo["grep"] = (texts, _grep_fold("\n".join(texts)))
+    return memo["grep"]
 
 
 def _find_spool_by_session(session_id: str) -> Optional[dict]:
@@ -514,14 +837,50 @@ def _count_running() -> int:
     Includes both "running" and "pending" spools, since pending spools
     represent reserved slots that will become running shortly.
     This prevents TOCTOU race in concurrency limit enforcement.
+
+    Counts from the spool index rather than a process-local set: other
+    spindle processes share SPINDLE_DIR and its limit, and the index refresh
+    only stats files that haven't changed.
     """
     return sum(
-        1 for s in _list_spools()
-        if s.get("status") in ("running", "pending")
+        1 for entry in _refresh_spool_index().values()
+        if entry["spool"].get("status") in ("running", "pending")
     )
 
 
-def _try_reserve_slot_and_create(spool_id: str, initial_status: str = "pending") -> tuple[bool, Optional[str]]:
+# Signalled whenever a spool leaves running/pending in this process, so
+# spin(wait=True) callers can retry without polling. _SLOT_GENERATION lets
+# a waiter notice a release that happened before it started waiting.
+_SLOT_FREED = threading.Condition()
+_SLOT_GENERATION = 0
+
+
+def _notify_slot_freed() -> None:
+    """Wake spin(wait=True) callers blocked in _try_reserve_slot_and_create."""
+    global _SLOT_GENERATION
+    with _SLOT_FREED:
+        _SLOT_GENERATION += 1
+        _SLOT_FREED.notify_all()
+
+
+# Callbacks run with the spool_id whenever a spool in this process reaches a
+# terminal status. The async spin_wait registers one per call and bounces it
+# onto its event loop, so a finish is seen without waiting out the interval.
+_SPOOL_DONE_LISTENERS: set[Callable[[str], None]] = set()
+_SPOOL_DONE_LOCK = threading.Lock()
+
+
+def _notify_spool_done(spool_id: str) -> None:
+    """Tell registered listeners that spool_id has left running/pending."""
+    with _SPOOL_DONE_LOCK:
+        listeners = list(_SPOOL_DONE_LISTENERS)
+    for listener in listeners:
+        listener(spool_id)
+
+
+def _try_reserve_slot_and_create(
+    spool_id: str, initial_status: str = "pending", wait: bool = False
+) -> tuple[bool, Optional[str]]:
     """
     Atomically check if we can spawn a new spool and create the initial spool file.
 
@@ -531,46 +890,89 @@ def _try_reserve_slot_and_create(spool_id: str, initial_status: str = "pending")
     Args:
         spool_id: The ID for the new spool
         initial_status: Initial status for the spool (default: "pending")
+        wait: If the limit is reached, block (up to SPIN_WAIT_TIMEOUT) until a
+              slot frees up instead of failing immediately
 
     Returns:
         (success, error_message): success is True if slot reserved and spool created,
                                   False if limit exceeded.
 
     Uses file locking to prevent TOCTOU race between check and spawn.
-    The lock is held during both the check and the initial spool creation.
+    The lock is held during both the check and the initial spool creation,
+    but never while waiting for a slot.
     """
     lock_file = SPINDLE_DIR / ".concurrency.lock"
     SPINDLE_DIR.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + SPIN_WAIT_TIMEOUT
 
-    # Open lock file (creates if needed)
-    with open(lock_file, "a") as f:
-        # Acquire exclusive lock - blocks if another thread holds it
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    while True:
+        with _SLOT_FREED:
+            generation = _SLOT_GENERATION
 
-        try:
-            # Now we have exclusive access - check the limit
-            running_count = _count_running()
-            if running_count >= MAX_CONCURRENT:
-                return False, f"Error: Max {MAX_CONCURRENT} concurrent spools. Wait for some to complete."
-
-            # Slot available - create the spool immediately while holding the lock
-            # This ensures the slot is claimed atomically
-            spool = {
-                "id": spool_id,
-                "status": initial_status,
-                "created_at": datetime.now().isoformat(),
-            }
-            _write_spool(spool_id, spool)
+        # Open lock file (creates if needed)
+        with open(lock_file, "a") as f:
+            # Acquire exclusive lock - blocks if another thread holds it
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
 
-            return True, None
-        finally:
-            # Release lock - happens automatically when context exits
-            # but explicit unlock is clearer
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            try:
+                # Now we have exclusive access - check the limit
+                running_count = _count_running()
+                if running_count < MAX_CONCURRENT:
+                    # Slot available - create the spool immediately while holding the lock
+                    # This ensures the slot is claimed atomically
+                    spool = {
+                        "id": spool_id,
+                        "status": initial_status,
+                        "created_at": datetime.now().isoformat(),
+                    }
+                    _write_spool(spool_id, spool)
+
+                    return True, None
+            finally:
+                # Release lock - happens automatically when context exits
+                # but explicit unlock is clearer
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        remaining = deadline - time.monotonic()
+        if not wait or remaining <= 0:
+            return False, f"Error: Max {MAX_CONCURRENT} concurrent spools. Wait for some to complete."
+
+        # Slots freed by this process wake us immediately; ones freed by other
+        # processes sharing SPINDLE_DIR are picked up on the next poll
+        with _SLOT_FREED:
+            _SLOT_FREED.wait_for(lambda: _SLOT_GENERATION != generation, min(remaining, MONITOR_POLL_INTERVAL))
+
+
+# pidfds for processes spawned by this server, keyed by PID (Linux only).
+# pidfds can't be persisted in spool JSON, so spools adopted from another
+# process fall back to os.kill(pid, 0).
+_PIDFDS: Dict[int, int] = {}
+_PIDFDS_LOCK = threading.Lock()
+
+# Popen objects for children tracked in _PIDFDS. Holding a reference stops
+# Popen.__del__ from reaping an already-exited child (and discarding its
+# exit status) before _reap_pid gets to it.
+_CHILDREN: Dict[int, subprocess.Popen] = {}
+
+# Children still running when _reap_pid gave up on them; a background thread
+# owns their pidfd until they exit
+_REAPING: set[int] = set()
 
 
 def _is_pid_alive(pid: int) -> bool:
-    """Check if a process is still running."""
+    """
+    Check if a process is still running.
+
+    For children we spawned, waits on the pidfd without reaping: this is
+    immune to PID reuse and reports exited-but-unreaped children as dead.
+    """
+    with _PIDFDS_LOCK:
+        pidfd = _PIDFDS.get(pid)
+        if pidfd is not None:
+            try:
+                return os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG | os.WNOWAIT) is None
+            except OSError:
+                pass  # Not our child (e.g. forked process) or already reaped
     try:
         os.kill(pid, 0)  # Doesn't kill, just checks
         return True
@@ -578,6 +980,137 @@ def _is_pid_alive(pid: int) -> bool:
         return False
 
 
+def _reap_pid(pid: int, timeout: float = 0.0) -> Optional[int]:
+    """
+    Reap a spawned child via its pidfd and release the pidfd.
+
+    Waits up to timeout seconds for the child to exit first. A child that is
+    still running afterwards (e.g. claude lingering after its result, or a
+    process slow to honour SIGTERM) is handed to a background thread that
+    reaps it once it exits, so it never stays behind as a zombie.
+
+    Returns the exit code (negative signal number if killed by a signal),
+    or None if unknown - no pidfd, or the process is still running.
+    """
+    with _PIDFDS_LOCK:
+        tracked = pid in _PIDFDS and pid not in _REAPING
+    if not tracked:
+        return None
+    if timeout > 0:
+        _wait_for_exit([pid], timeout)
+
+    with _PIDFDS_LOCK:
+        pidfd = _PIDFDS.get(pid)
+        if pidfd is None or pid in _REAPING:
+            return None
+        try:
+            info = os.waitid(os.P_PIDFD, pidfd, os.WEXITED | os.WNOHANG)
+        except OSError:
+            info = None  # Not our child any more; just release the pidfd
+        else:
+            if info is None:
+                _REAPING.add(pid)
+                threading.Thread(
+                    target=_reap_when_exited, args=(pid, pidfd), daemon=True, name=f"spindle-reap-{pid}"
+                ).start()
+                return None
+        del _PIDFDS[pid]
+        proc = _CHILDREN.pop(pid, None)
+    os.close(pidfd)
+
+    if info is None:
+        return None
+    exit_code = info.si_status if info.si_code == os.CLD_EXITED else -info.si_status
+    if proc is not None:
+        proc.returncode = exit_code  # Already reaped - keep Popen from waiting again
+    return exit_code
+
+
+def _reap_when_exited(pid: int, pidfd: int) -> None:
+    """Block until a still-running child exits, then reap it and release its pidfd."""
+    try:
+        info = os.waitid(os.P_PIDFD, pidfd, os.WEXITED)
+    except OSError:
+        info = None
+    with _PIDFDS_LOCK:
+        _PIDFDS.pop(pid, None)
+        proc = _CHILDREN.pop(pid, None)
+        _REAPING.discard(pid)
+    os.close(pidfd)
+    if proc is not None and info is not None:
+        proc.returncode = info.si_status if info.si_code == os.CLD_EXITED else -info.si_status
+
+
+def _signal_process(pid: int, sig: int, group: bool = True) -> None:
+    """
+    Send a signal to a spawned process, or to its process group.
+
+    Spools run in their own session (start_new_session), so the PID doubles
+    as the process group ID. When we hold a pidfd the signal goes through
+    pidfd_send_signal first, which targets the exact process we spawned; if
+    that process has already been reaped its PID may belong to someone else
+    now, so nothing else is signalled. Errors are swallowed - a process that
+    is already gone needs no signal.
+    """
+    with _PIDFDS_LOCK:
+        pidfd = _PIDFDS.get(pid)
+        if pidfd is not None:
+            try:
+                signal.pidfd_send_signal(pidfd, sig)
+            except ProcessLookupError:
+                return  # Already reaped
+            except OSError:
+                pass
+            else:
+                if not group:
+                    return
+
+    try:
+        if group:
+            os.killpg(pid, sig)
+        else:
+            os.kill(pid, sig)
+    except ProcessLookupError:
+        pass  # Already dead
+    except OSError:
+        if group:
+            # Try signalling just the process
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                pass
+
+
+def _no_output_error(spool: dict) -> str:
+    """Error message for a process that exited without writing any output."""
+    if spool.get("exit_code") is not None:
+        return f"Process exited with code {spool['exit_code']} and no output"
+    return "Process exited with no output"
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse a stored ISO-8601 timestamp.
+
+    Spool timestamps never change once written, and the same ones are parsed
+    again on every listing/cleanup pass, so parses are memoized.
+    Raises ValueError for malformed input, like datetime.fromisoformat.
+    """
+    return datetime.fromisoformat(timestamp)
+
+
+@functools.lru_cache(maxsize=4096)
+def _timestamp_epoch(timestamp: str) -> float:
+    """
+    Convert a stored local-time timestamp to seconds since the epoch.
+
+    Lets per-poll elapsed-time checks be a time.time() subtraction; memoized
+    like _parse_timestamp, since the local-time conversion isn't free.
+    """
+    return _parse_timestamp(timestamp).timestamp()
+
+
 def _parse_duration(time_str: str) -> Optional[int]:
     """
     Parse a duration string into seconds.
@@ -651,40 +1184,110 @@ def _parse_duration(time_str: str) -> Optional[int]:
     return None
 
 
+def _delete_spool_files(spool_id: str) -> None:
+    """Remove a spool's JSON record plus its output and lock files."""
+    for path in (
+        _get_spool_path(spool_id),
+        _get_output_path(spool_id),
+        _get_stderr_path(spool_id),
+        _get_lock_path(spool_id),
+    ):
+        path.unlink(missing_ok=True)
+
+
 def _cleanup_old_spools() -> None:
-    """Remove spool files older than 24 hours."""
-    if not SPINDLE_DIR.exists():
-        return
+    """
+    Remove spool files older than 24 hours.
 
+    A spool file is rewritten on every status change but never before the
+    spool is created, so a file whose mtime is past the cutoff is expired
+    without parsing it - corrupt files included. The remaining spools are
+    checked by created_at via the spool index, so only files changed since
+    the last pass are parsed.
+    """
     cutoff = datetime.now() - timedelta(hours=24)
+    cutoff_ns = int(cutoff.timestamp() * 1_000_000_000)
+
+    def delete(spool_id: str) -> None:
+        # Use lock to prevent race with finalization
+        with _spool_lock(spool_id, blocking=False) as acquired:
+            if acquired:  # Skip if locked
+                _delete_spool_files(spool_id)
+
+    stale = []
+    try:
+        with os.scandir(SPINDLE_DIR) as it:
+            for dirent in it:
+                if not dirent.name.endswith(".json"):
+                    continue
+                try:
+                    if dirent.stat(follow_symlinks=False).st_mtime_ns < cutoff_ns:
+                        stale.append(dirent.name[:-5])
+                except OSError:
+                    continue
+    except OSError:
+        return
 
-    for path in SPINDLE_DIR.glob("*.json"):
+    for spool_id in stale:
         try:
-            with open(path) as f:
-                data = json.load(f)
+            delete(spool_id)
+        except Exception:
+            pass
 
-            spool_id = data.get("id", path.stem)
-            created = datetime.fromisoformat(data.get("created_at", ""))
+    for spool_id, entry in _refresh_spool_index().items():
+        try:
+            created = _parse_timestamp(entry["spool"].get("created_at", ""))
             if created < cutoff:
-                # Use lock to prevent race with finalization
-                with _spool_lock(spool_id, blocking=False) as acquired:
-                    if not acquired:
-                        continue  # Skip if locked
-                    path.unlink()
-                    # Also clean up output, lock, and transcript files
-                    stdout_path = _get_output_path(spool_id)
-                    stderr_path = _get_stderr_path(spool_id)
-                    lock_path = _get_lock_path(spool_id)
-                    if stdout_path.exists():
-                        stdout_path.unlink()
-                    if stderr_path.exists():
-                        stderr_path.unlink()
-                    if lock_path.exists():
-                        lock_path.unlink()
+                delete(spool_id)
         except Exception:
             pass
 
 
+# Probe state for each stdout file being watched, keyed by path:
+# {"ino", "stamp": (size, mtime_ns), "offset": int} plus whatever the caller
+# carries between probes. Output files only grow, so each probe reads just
+# the new bytes, and an unchanged stamp means the previous "incomplete"
+# verdict still holds. The output itself isn't kept - a long stream-json run
+# would otherwise sit in memory until it finishes.
+_STDOUT_TAILS: Dict[str, dict] = {}
+
+
+def _read_new_output(path: Path) -> Optional[tuple[dict, bytes]]:
+    """
+    Catch up on a growing stdout file, reading only bytes not seen before.
+
+    Returns the file's probe state and the bytes appended since the last
+    call, or None if the file is missing, empty or unchanged. A new or
+    truncated file starts a fresh state, dropping whatever the caller kept.
+    """
+    key = str(path)
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return None
+    try:
+        st = os.fstat(fd)
+        stamp = (st.st_size, st.st_mtime_ns)
+        state = _STDOUT_TAILS.get(key)
+        if not st.st_size or (state is not None and state["stamp"] == stamp):
+            return None
+        if state is None or state["ino"] != st.st_ino or st.st_size < state["offset"]:
+            # New or truncated file: start over
+            state = {"ino": st.st_ino, "offset": 0}
+        new = bytearray()
+        while state["offset"] + len(new) < st.st_size:
+            chunk = os.pread(fd, st.st_size - state["offset"] - len(new), state["offset"] + len(new))
+            if not chunk:
+                break
+            new += chunk
+        state["offset"] += len(new)
+        state["stamp"] = stamp
+        _STDOUT_TAILS[key] = state
+        return state, bytes(new)
+    finally:
+        os.close(fd)
+
+
 def _check_and_finalize_spool(spool_id: str) -> bool:
     """
     Check if a spool's process has finished and finalize it.
@@ -703,66 +1306,93 @@ def _check_and_finalize_spool(spool_id: str) -> bool:
             # The other process will complete finalization
             return False
 
+        stdout_path = _get_output_path(spool_id)
+
         spool = _read_spool(spool_id)
         if not spool or spool.get("status") != "running":
+            _STDOUT_TAILS.pop(str(stdout_path), None)
+            # Dropped, timed out or abandoned elsewhere: the child may still
+            # need reaping
+            if spool and spool.get("pid"):
+                _reap_pid(spool["pid"])
             return True  # Already done
 
         pid = spool.get("pid")
         if not pid:
             return False  # No PID yet, still starting
 
-        stdout_path = _get_output_path(spool_id)
         stderr_path = _get_stderr_path(spool_id)
 
         # Check if stdout has complete JSON result (claude may not exit promptly)
         # For Codex, check for "turn.completed" event in newline-delimited JSON
+        # Only output appended since the last probe is read; nothing is read
+        # if stdout hasn't changed since the last probe found it incomplete
         stdout_complete = False
-        if stdout_path.exists():
+        content = None
+        data = None
+        probe_key = str(stdout_path)
+        probed = _read_new_output(stdout_path)
+        if probed is not None:
+            tail, new = probed
             try:
-                content = stdout_path.read_text()
-                if content.strip():
-                    # Check harness type to determine completion detection method
-                    if spool.get("harness") == "codex":
-                        # Codex uses newline-delimited JSON with "turn.completed" event
-                        for line in content.strip().split('\n'):
-                            try:
-                                event = json.loads(line)
-                                if event.get("type") == "turn.completed":
-                                    stdout_complete = True
-                                    break
-                            except json.JSONDecodeError:
-                                continue
-                    else:
-                        # Claude Code uses single JSON object with "result" or "error"
-                        data = json.loads(content)
+                # Check harness type to determine completion detection method
+                if spool.get("harness") == "codex":
+                    # Codex uses newline-delimited JSON with "turn.completed"
+                    # event; only lines not scanned before are parsed. The
+                    # trailing partial line is kept and rescanned next probe.
+                    lines = (tail.get("partial", b"") + new).split(b"\n")
+                    for line in lines:
+                        try:
+                            event = _json_loads(line)
+                            if event.get("type") == "turn.completed":
+                                stdout_complete = True
+                                break
+                        except ValueError:
+                            # Not JSON, or bytes cut mid-character (json.loads
+                            # raises UnicodeDecodeError for those)
+                            continue
+                    tail["partial"] = lines[-1]
+                else:
+                    # Claude Code uses single JSON object with "result" or "error".
+                    # Decoding is only worth it once one of those keys shows up
+                    # in the output; look for them in the new bytes (plus a
+                    # key's length of overlap) rather than decoding every time.
+                    if not tail.get("key_seen"):
+                        window = tail.get("overlap", b"") + new
+                        tail["key_seen"] = b'"result"' in window or b'"error"' in window
+                        tail["overlap"] = window[-len(b'"result"'):]
+                    tail["last"] = (tail.get("last", b"") + new)[-64:]
+                    # Nor before the object can be closed: the last
+                    # non-space byte of a complete result is its "}"
+                    if tail["key_seen"] and tail["last"].rstrip().endswith(b"}"):
+                        raw = stdout_path.read_bytes()
+                        data = _json_loads(raw)
                         if "result" in data or "error" in data:
                             stdout_complete = True
-            except (IOError, json.JSONDecodeError):
-                pass
+                            content = raw.decode(errors="replace")
+            except (ValueError, OSError):
+                data = None
 
         # If PID alive and no complete output yet, still running
         if _is_pid_alive(pid) and not stdout_complete:
             return False
+        _STDOUT_TAILS.pop(probe_key, None)
 
         # Process finished or output complete - finalize
-        # Re-read paths (they're the same but clearer for the finalization section)
-        stdout_path = _get_output_path(spool_id)
-        stderr_path = _get_stderr_path(spool_id)
-
-        stdout = ""
-        stderr = ""
-
-        if stdout_path.exists():
-            try:
-                stdout = stdout_path.read_text()
-            except IOError:
-                pass
+        # Record the real exit status when we spawned the process ourselves
+        exit_code = _reap_pid(pid)
+        if exit_code is not None:
+            spool["exit_code"] = exit_code
+
+        # A complete Claude result can't change any more, so reuse what the
+        # probe read (and parsed) instead of reading the file a second time
+        if content is not None:
+            stdout = content
+        else:
+            data = None
+            stdout = _read_text(stdout_path)
 
-        if stderr_path.exists():
-            try:
-                stderr = stderr_path.read_text()
-            except IOError:
-                pass
+        stderr = _read_text(stderr_path)
 
         # Parse result based on harness type
         if spool.get("harness") == "codex":
@@ -776,7 +1406,7 @@ def _check_and_finalize_spool(spool_id: str) -> bool:
                     # Try to extract session_id from thread.started event
                     for line in stdout.strip().split('\n'):
                         try:
-                            event = json.loads(line)
+                            event = _json_loads(line)
                             if event.get("type") == "thread.started":
                                 spool["session_id"] = event.get("thread_id")
                             elif event.get("type") == "turn.completed":
@@ -793,7 +1423,7 @@ def _check_and_finalize_spool(spool_id: str) -> bool:
                     spool["error"] = stderr[:500]
                 else:
                     spool["status"] = "error"
-                    spool["error"] = "Process exited with no output"
+                    spool["error"] = _no_output_error(spool)
             except Exception:
                 # Fallback: treat as raw output
                 if stdout.strip():
@@ -805,7 +1435,8 @@ def _check_and_finalize_spool(spool_id: str) -> bool:
         else:
             # Parse Claude Code single JSON object format
             try:
-                data = json.loads(stdout)
+                if data is None:
+                    data = _json_loads(stdout)
                 spool["result"] = data.get("result", stdout)
                 spool["session_id"] = data.get("session_id")
                 spool["cost"] = data.get("cost")
@@ -819,7 +1450,7 @@ def _check_and_finalize_spool(spool_id: str) -> bool:
                     spool["error"] = stderr[:500]
                 else:
                     spool["status"] = "error"
-                    spool["error"] = "Process exited with no output"
+                    spool["error"] = _no_output_error(spool)
 
         spool["completed_at"] = datetime.now().isoformat()
         _write_spool(spool_id, spool)
@@ -835,19 +1466,27 @@ def _check_and_finalize_spool(spool_id: str) -> bool:
                 pass  # Non-critical, continue
 
         # Clean up output files
-        if stdout_path.exists():
-            stdout_path.unlink()
-        if stderr_path.exists():
-            stderr_path.unlink()
+        stdout_path.unlink(missing_ok=True)
+        stderr_path.unlink(missing_ok=True)
 
         return True
 
 
 def _recover_orphans() -> None:
-    """Check all running spools and finalize any that have completed."""
-    for spool in _list_spools():
-        if spool.get("status") == "running":
-            _check_and_finalize_spool(spool["id"])
+    """
+    Check all running spools and finalize any that have completed.
+
+    Runs at import, so with several spools to check they are finalized in
+    parallel to keep server startup short.
+    """
+    running = [spool["id"] for spool in _list_spools() if spool.get("status") == "running"]
+    if len(running) <= 1:
+        for spool_id in running:
+            _check_and_finalize_spool(spool_id)
+        return
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="spindle-recover") as pool:
+        # Consume the results so a failure surfaces as it did when run inline
+        list(pool.map(_check_and_finalize_spool, running))
 
 
 def _handle_expired_session(spool_id: str, spool: dict) -> bool:
@@ -869,13 +1508,7 @@ def _handle_expired_session(spool_id: str, spool: dict) -> bool:
     # Kill the failing process
     pid = spool.get("pid")
     if pid and _is_pid_alive(pid):
-        try:
-            os.kill(pid, signal.SIGTERM)
-            time.sleep(0.2)
-            if _is_pid_alive(pid):
-                os.kill(pid, signal.SIGKILL)
-        except (ProcessLookupError, OSError):
-            pass
+        _terminate_process(pid, grace=0.2)
 
     # Read transcript
     try:
@@ -893,7 +1526,7 @@ def _handle_expired_session(spool_id: str, spool: dict) -> bool:
 Continue from above. New message: {spool['prompt'].split(': ', 1)[-1]}"""
 
     # Spawn new process without --resume flag, with transcript as context
-    cmd = ["claude", "-p", context_prompt, "--output-format", "json"]
+    cmd = _claude_cmd(context_prompt)
 
     try:
         # Inherit env from spool if available
@@ -911,48 +1544,367 @@ Continue from above. New message: {spool['prompt'].split(': ', 1)[-1]}"""
         return False
 
 
-def _monitor_spool(spool_id: str) -> None:
-    """Background thread that monitors a spool until completion."""
-    while True:
-        # Check for timeout
+def _enforce_timeout(spool_id: str, spool: Optional[dict]) -> bool:
+    """
+    Kill and mark a spool that has run past its timeout.
+
+    The status is re-read under the spool lock, so a spool finalized (or
+    dropped) in the meantime keeps its outcome instead of being overwritten
+    with "timeout".
+
+    Returns:
+        True if the spool is past its timeout and no longer running
+    """
+    if not spool or not spool.get("timeout"):
+        return False
+    if time.time() - _timestamp_epoch(spool["created_at"]) <= spool["timeout"]:
+        return False
+
+    with _spool_lock(spool_id):
         spool = _read_spool(spool_id)
-        if spool and spool.get("timeout"):
-            created = datetime.fromisoformat(spool["created_at"])
-            elapsed = (datetime.now() - created).total_seconds()
-            if elapsed > spool["timeout"]:
-                # Kill the process
-                pid = spool.get("pid")
-                if pid and _is_pid_alive(pid):
-                    try:
-                        os.kill(pid, signal.SIGTERM)
-                        time.sleep(0.5)
-                        if _is_pid_alive(pid):
-                            os.kill(pid, signal.SIGKILL)
-                    except ProcessLookupError:
-                        pass
-                # Mark as timeout
-                spool["status"] = "timeout"
-                spool["error"] = f'Timeout after {spool["timeout"]}s'
-                spool["completed_at"] = datetime.now().isoformat()
-                _write_spool(spool_id, spool)
+        if not spool or spool.get("status") != "running":
+            return True
+
+        # Kill the process
+        pid = spool.get("pid")
+        if pid:
+            if _is_pid_alive(pid):
+                _terminate_process(pid, grace=0.5)
+            _reap_pid(pid, timeout=0.5)
+        # Mark as timeout
+        spool["status"] = "timeout"
+        spool["error"] = f'Timeout after {spool["timeout"]}s'
+        spool["completed_at"] = datetime.now().isoformat()
+        _write_spool(spool_id, spool)
+    return True
+
+
+# What claude prints to stderr when a resumed session no longer exists
+_SESSION_EXPIRED = b"No conversation found with session ID"
+
+# How far each stderr file has been scanned for _SESSION_EXPIRED, keyed by
+# path: {"ino", "offset", "found"}. Each check reads only what was appended
+# since; once seen, the message stays reported until the file is replaced.
+_STDERR_SCANS: Dict[str, dict] = {}
+
+
+def _stderr_has_session_expired(spool_id: str) -> bool:
+    """Check a spool's stderr for _SESSION_EXPIRED, reading only new bytes."""
+    path = str(_get_stderr_path(spool_id))
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return False
+    try:
+        st = os.fstat(fd)
+        state = _STDERR_SCANS.get(path)
+        if state is None or state["ino"] != st.st_ino or st.st_size < state["offset"]:
+            # New or truncated file (e.g. after a transcript fallback respawn)
+            state = _STDERR_SCANS[path] = {"ino": st.st_ino, "offset": 0, "found": False}
+        if state["found"] or st.st_size == state["offset"]:
+            return state["found"]
+        # Back up a little so a message split across two checks is still found
+        start = max(0, state["offset"] - len(_SESSION_EXPIRED) + 1)
+        chunk = os.pread(fd, st.st_size - start, start)
+        state["offset"] = start + len(chunk)
+        state["found"] = _SESSION_EXPIRED in chunk
+        return state["found"]
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def _poll_spool(spool_id: str) -> bool:
+    """
+    Run one monitoring pass over a spool.
+
+    Handles timeout, expired-session fallback and finalization.
+    Returns True once the spool no longer needs monitoring.
+    """
+    # Check for timeout
+    spool = _read_spool(spool_id)
+    if _enforce_timeout(spool_id, spool):
+        _STDERR_SCANS.pop(str(_get_stderr_path(spool_id)), None)
+        return True
+
+    # For respin spools, check for "session not found" error early
+    if spool and spool.get("session_id") and spool.get("status") == "running":
+        if _stderr_has_session_expired(spool_id):
+            # Session expired - try transcript fallback
+            if _handle_expired_session(spool_id, spool):
+                return True  # Successfully retried with transcript
+
+    done = _check_and_finalize_spool(spool_id)
+    if done:
+        _STDERR_SCANS.pop(str(_get_stderr_path(spool_id)), None)
+    return done
+
+
+# Single supervisor thread that polls every active spool, instead of one
+# sleeping monitor thread per spool. spin/respin hand spools over through
+# _SUPERVISOR_QUEUE and write a byte to the wake pipe so the supervisor
+# re-plans its wait.
+_SUPERVISOR: Optional[threading.Thread] = None
+_SUPERVISOR_LOCK = threading.Lock()
+_SUPERVISOR_QUEUE: "queue.SimpleQueue[tuple[str, Callable[[str], bool], Optional[int]]]" = queue.SimpleQueue()
+_SUPERVISOR_WAKE_R, _SUPERVISOR_WAKE_W = os.pipe()
+os.set_blocking(_SUPERVISOR_WAKE_R, False)
+os.set_blocking(_SUPERVISOR_WAKE_W, False)
+
+
+def _wake_supervisor() -> None:
+    """Interrupt the supervisor's wait."""
+    try:
+        os.write(_SUPERVISOR_WAKE_W, b"\0")
+    except BlockingIOError:
+        pass  # Pipe full - a wakeup is already pending
+
+
+def _dup_pidfd(pid: Optional[int]) -> Optional[int]:
+    """
+    Duplicate the pidfd of a spawned child, if we hold one.
+
+    The copy belongs to the caller, so it stays valid for polling even after
+    _reap_pid closes the original.
+    """
+    if pid is None:
+        return None
+    with _PIDFDS_LOCK:
+        pidfd = _PIDFDS.get(pid)
+        if pidfd is None:
+            return None
+        try:
+            return os.dup(pidfd)
+        except OSError:
+            return None
+
+
+def _wait_for_exit(pids: list[int], timeout: float) -> list[int]:
+    """
+    Block until one of the given children exits, or timeout seconds pass.
+
+    Only children spawned by this process have pidfds to wait on; with none
+    of those this is a plain sleep, and callers re-check everything after
+    the timeout either way.
+
+    Returns:
+        The PIDs seen to have exited
+    """
+    fds = {}
+    for pid in pids:
+        pidfd = _dup_pidfd(pid)
+        if pidfd is not None:
+            fds[pidfd] = pid
+    try:
+        if not fds:
+            time.sleep(timeout)
+            return []
+        poller = select.poll()
+        for pidfd in fds:
+            poller.register(pidfd, select.POLLIN)
+        return [fds[fd] for fd, _ in poller.poll(int(timeout * 1000))]
+    finally:
+        for pidfd in fds:
+            os.close(pidfd)
+
+
+def _terminate_process(pid: int, grace: float) -> None:
+    """
+    SIGTERM a process, then SIGKILL it if it is still alive after grace seconds.
+
+    For our own children the grace period ends as soon as the pidfd reports
+    the exit, so a process that stops promptly isn't waited on in full.
+    """
+    _signal_process(pid, signal.SIGTERM, group=False)
+    _wait_for_exit([pid], grace)
+    if _is_pid_alive(pid):
+        _signal_process(pid, signal.SIGKILL, group=False)
+
+
+async def _wait_for_exit_async(pids: list[int], timeout: float) -> list[int]:
+    """Event-loop counterpart of _wait_for_exit, watching pidfds with add_reader."""
+    fds = {}
+    for pid in pids:
+        pidfd = _dup_pidfd(pid)
+        if pidfd is not None:
+            fds[pidfd] = pid
+    if not fds:
+        await asyncio.sleep(timeout)
+        return []
+
+    loop = asyncio.get_running_loop()
+    fired = loop.create_future()
+    exited = []
+
+    def on_exit(pidfd: int) -> None:
+        loop.remove_reader(pidfd)
+        exited.append(fds[pidfd])
+        if not fired.done():
+            fired.set_result(None)
+
+    try:
+        for pidfd in fds:
+            loop.add_reader(pidfd, on_exit, pidfd)
+        await asyncio.wait({fired}, timeout=timeout)
+        return exited
+    finally:
+        for pidfd in fds:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+
+def _supervise_spools() -> None:
+    """
+    Supervisor loop: poll each active spool every MONITOR_POLL_INTERVAL.
+
+    A spool's first check happens one interval after it is handed over,
+    matching the cadence of the old per-spool monitor threads. For children
+    spawned by this process the supervisor also waits on their pidfds, so
+    an exit is picked up immediately rather than on the next interval. Old
+    spools are also cleaned up here every CLEANUP_INTERVAL, not just on
+    import.
+    """
+    # spool_id -> [poll, due, pidfd]
+    active: Dict[str, list] = {}
+    # (due, spool_id) per scheduled check, soonest first. Rescheduling pushes
+    # a new entry; ones whose due no longer matches active[spool_id] are stale.
+    due_heap: list[tuple[float, str]] = []
+    next_cleanup = time.monotonic() + CLEANUP_INTERVAL
+    poller = select.poll()
+    poller.register(_SUPERVISOR_WAKE_R, select.POLLIN)
+    by_fd: Dict[int, str] = {}
+
+    def schedule(spool_id: str, state: list, due: float) -> None:
+        state[1] = due
+        heapq.heappush(due_heap, (due, spool_id))
+
+    def forget_pidfd(state: list) -> None:
+        pidfd = state[2]
+        if pidfd is not None:
+            poller.unregister(pidfd)
+            del by_fd[pidfd]
+            os.close(pidfd)
+            state[2] = None
+
+    while True:
+        while True:
+            try:
+                spool_id, poll, pid = _SUPERVISOR_QUEUE.get_nowait()
+            except queue.Empty:
                 break
+            if spool_id in active:
+                forget_pidfd(active[spool_id])
+            pidfd = _dup_pidfd(pid)
+            if pidfd is not None:
+                poller.register(pidfd, select.POLLIN)
+                by_fd[pidfd] = spool_id
+            active[spool_id] = state = [poll, 0.0, pidfd]
+            schedule(spool_id, state, time.monotonic() + MONITOR_POLL_INTERVAL)
+
+        # Only spools that are due get looked at
+        now = time.monotonic()
+        while due_heap and due_heap[0][0] <= now:
+            due, spool_id = heapq.heappop(due_heap)
+            state = active.get(spool_id)
+            if state is None or state[1] != due:
+                continue
+            try:
+                done = state[0](spool_id)
+            except Exception as e:
+                logger.warning(f"Stopped monitoring spool {spool_id}: {e}")
+                done = True
+            if done:
+                forget_pidfd(state)
+                del active[spool_id]
+            else:
+                schedule(spool_id, state, time.monotonic() + MONITOR_POLL_INTERVAL)
 
-        # For respin spools, check for "session not found" error early
-        if spool and spool.get("session_id") and spool.get("status") == "running":
-            stderr_path = _get_stderr_path(spool_id)
-            if stderr_path.exists():
+        if now >= next_cleanup:
+            try:
+                _cleanup_old_spools()
+            except Exception as e:
+                logger.warning(f"Spool cleanup failed: {e}")
+            next_cleanup = time.monotonic() + CLEANUP_INTERVAL
+
+        # Wait until a child exits, a spool is handed over, the next spool
+        # is due or cleanup runs
+        wake_at = min(due_heap[0][0], next_cleanup) if due_heap else next_cleanup
+        timeout_ms = max(0, int((wake_at - time.monotonic()) * 1000) + 1)
+        for fd, _ in poller.poll(timeout_ms):
+            if fd == _SUPERVISOR_WAKE_R:
                 try:
-                    stderr_content = stderr_path.read_text()
-                    if "No conversation found with session ID" in stderr_content:
-                        # Session expired - try transcript fallback
-                        if _handle_expired_session(spool_id, spool):
-                            break  # Successfully retried with transcript
-                except IOError:
+                    while os.read(_SUPERVISOR_WAKE_R, 4096):
+                        pass
+                except BlockingIOError:
                     pass
+                continue
+            spool_id = by_fd.get(fd)
+            if spool_id is None:
+                continue
+            # The child exited: check it now. A pidfd stays readable once the
+            # process is gone, so later checks fall back to the interval.
+            state = active[spool_id]
+            forget_pidfd(state)
+            schedule(spool_id, state, 0.0)
+
+
+def _monitor_spool(
+    spool_id: str,
+    poll: Optional[Callable[[str], bool]] = None,
+    pid: Optional[int] = None,
+) -> None:
+    """
+    Hand a spool to the supervisor thread, starting it if needed.
+
+    Args:
+        spool_id: The spool to monitor until completion
+        poll: Per-harness monitoring pass (default: _poll_spool)
+        pid: The spool's process, if spawned by us; its exit wakes the
+            supervisor straight away
+    """
+    global _SUPERVISOR
+
+    _SUPERVISOR_QUEUE.put((spool_id, poll or _poll_spool, pid))
+    with _SUPERVISOR_LOCK:
+        if _SUPERVISOR is None or not _SUPERVISOR.is_alive():
+            _SUPERVISOR = threading.Thread(target=_supervise_spools, name="spindle-supervisor", daemon=True)
+            _SUPERVISOR.start()
+    _wake_supervisor()
+
+
+def _bwrap_binds(paths: tuple[str, ...]) -> tuple[str, ...]:
+    """Get "--bind", path, path arguments for those of paths that exist."""
+    cached = _BWRAP_BINDS.get(paths)
+    if cached is not None and time.monotonic() - cached[0] < _BWRAP_BINDS_TTL:
+        return cached[1]
+    binds = tuple(arg for path in paths if os.path.exists(path) for arg in ("--bind", path, path))
+    _BWRAP_BINDS[paths] = (time.monotonic(), binds)
+    return binds
 
-        if _check_and_finalize_spool(spool_id):
-            break
-        time.sleep(MONITOR_POLL_INTERVAL)
+
+def _claude_cmd(
+    prompt: str,
+    resume: Optional[str] = None,
+    model: Optional[str] = None,
+    permission_mode: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    allowed_tools: Optional[str] = None,
+) -> list[str]:
+    """Build a claude CLI command line (print mode, JSON output)."""
+    cmd = ["claude", "-p", prompt]
+    if resume:
+        cmd += ("--resume", resume)
+    cmd += ("--output-format", "json")
+    if model:
+        cmd += ("--model", model)
+    if permission_mode:
+        cmd += ("--permission-mode", permission_mode)
+    if system_prompt:
+        cmd += ("--system-prompt", system_prompt)
+    if allowed_tools:
+        cmd += ("--allowedTools", allowed_tools)
+    return cmd
 
 
 def _spawn_detached(spool_id: str, cmd: list, cwd: str, env: Optional[Dict[str, str]] = None) -> int:
@@ -969,24 +1921,83 @@ def _spawn_detached(spool_id: str, cmd: list, cwd: str, env: Optional[Dict[str,
     stdout_path = _get_output_path(spool_id)
     stderr_path = _get_stderr_path(spool_id)
 
-    # Start with current environment, then merge in any custom vars
-    process_env = os.environ.copy()
-    if env:
-        process_env.update(env)
-
-    with open(stdout_path, "w") as stdout_file, open(stderr_path, "w") as stderr_file:
-        proc = subprocess.Popen(
-            cmd,
-            stdout=stdout_file,
-            stderr=stderr_file,
-            cwd=cwd,
-            env=process_env,
-            start_new_session=True,  # Detach from parent
-        )
+    # Inherit our environment as-is unless there are custom vars to merge in
+    process_env = {**os.environ, **env} if env else None
+
+    # Keep this Popen free of preexec_fn: without it CPython spawns via
+    # vfork (3.10+), so the server's page tables aren't copied. posix_spawn
+    # itself is unavailable here because we need cwd, and process_group=0
+    # would not detach from our session the way setsid does.
+    # Raw descriptors are all the child needs; Popen dups them onto its
+    # stdout/stderr, so ours are closed right after the spawn
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | os.O_CLOEXEC
+    stdout_fd = os.open(stdout_path, flags, 0o644)
+    try:
+        stderr_fd = os.open(stderr_path, flags, 0o644)
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=stdout_fd,
+                stderr=stderr_fd,
+                cwd=cwd,
+                env=process_env,
+                start_new_session=True,  # Detach from parent
+            )
+        finally:
+            os.close(stderr_fd)
+    finally:
+        os.close(stdout_fd)
+
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pass  # Kernel without pidfd support
+        else:
+            with _PIDFDS_LOCK:
+                _PIDFDS[proc.pid] = pidfd
+                _CHILDREN[proc.pid] = proc
 
     return proc.pid
 
 
+def _start_spool(
+    spool: dict,
+    cmd: list,
+    cwd: str,
+    env: Optional[Dict[str, str]],
+    poll: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """
+    Spawn a spool's process, record it as running and start monitoring it.
+
+    The full record is written once, after the PID is known; until then the
+    reservation from _try_reserve_slot_and_create holds the slot. If the
+    spawn fails the spool is recorded as an error, releasing the slot.
+
+    Returns:
+        The spool_id, or an error message if the process couldn't be started
+    """
+    spool_id = spool["id"]
+    try:
+        pid = _spawn_detached(spool_id, cmd, cwd, env)
+    except Exception as e:
+        spool["status"] = "error"
+        spool["error"] = f"Failed to start process: {e}"
+        spool["completed_at"] = datetime.now().isoformat()
+        _write_spool(spool_id, spool)
+        return f"Error: Failed to start spool {spool_id}: {e}"
+
+    spool["pid"] = pid
+    spool["status"] = "running"
+    _write_spool(spool_id, spool)
+
+    # Hand off to the supervisor thread
+    _monitor_spool(spool_id, poll, pid)
+
+    return spool_id
+
+
 # Run cleanup and recovery on module load
 _cleanup_old_spools()
 _recover_orphans()
@@ -1004,6 +2015,7 @@ def _spin_sync(
     timeout: Optional[int],
     skeinless: bool,
     env: Optional[Dict[str, str]],
+    wait: bool = False,
 ) -> str:
     """Synchronous implementation of spin - runs in thread pool."""
     # Require working_dir - os.getcwd() returns MCP server dir, not caller's project
@@ -1015,7 +2027,7 @@ def _spin_sync(
 
     # Atomically check concurrency limit and create initial spool entry
     # This reserves the slot by creating a spool that counts toward the limit
-    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending")
+    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending", wait=wait)
     if not success:
         return error_msg
 
@@ -1069,29 +2081,26 @@ Your task:
 """
         effective_prompt = shard_preamble + prompt
 
-    claude_cmd = ["claude", "-p", effective_prompt, "--output-format", "json"]
-
-    if model:
-        claude_cmd.extend(["--model", model])
-
     # Auto-accept edits for non-interactive execution
     # Use acceptEdits for careful mode, bypassPermissions for full/shard
     if permission in ("full", "shard") or (permission and "+shard" in permission):
-        claude_cmd.extend(["--permission-mode", "bypassPermissions"])
+        permission_mode = "bypassPermissions"
     else:
-        claude_cmd.extend(["--permission-mode", "acceptEdits"])
-
-    if system_prompt:
-        claude_cmd.extend(["--system-prompt", system_prompt])
-
-    if resolved_tools:
-        claude_cmd.extend(["--allowedTools", resolved_tools])
+        permission_mode = "acceptEdits"
+
+    claude_cmd = _claude_cmd(
+        effective_prompt,
+        model=model,
+        permission_mode=permission_mode,
+        system_prompt=system_prompt,
+        allowed_tools=resolved_tools,
+    )
 
     # Wrap in bwrap sandbox for shards - worktree writable, rest read-only
-    if shard_info and shutil.which("bwrap"):
+    if shard_info and _BWRAP_PATH:
         home = str(Path.home())
         cmd = [
-            "bwrap",
+            _BWRAP_PATH,
             "--ro-bind",
             "/",
             "/",  # Root read-only
@@ -1124,30 +2133,24 @@ Your task:
                     # Main .git directory for objects and refs
                     # gitdir is like: /path/to/repo/.git/worktrees/<name>
                     main_git = Path(git_worktree_dir).parent.parent
-                    if main_git.exists() and main_git.name == ".git":
-                        # Objects - for storing commits (append-only)
-                        objects_dir = main_git / "objects"
-                        if objects_dir.exists():
-                            cmd.extend(["--bind", str(objects_dir), str(objects_dir)])
-                        # Refs/heads - for branch pointers (not remotes/tags)
-                        refs_heads = main_git / "refs" / "heads"
-                        if refs_heads.exists():
-                            cmd.extend(["--bind", str(refs_heads), str(refs_heads)])
-                        # Logs/refs/heads - for reflogs
-                        logs_refs_heads = main_git / "logs" / "refs" / "heads"
-                        if logs_refs_heads.exists():
-                            cmd.extend(["--bind", str(logs_refs_heads), str(logs_refs_heads)])
+                    if main_git.name == ".git":
+                        # Shared by every shard of the repo:
+                        # objects - for storing commits (append-only),
+                        # refs/heads - for branch pointers (not remotes/tags),
+                        # logs/refs/heads - for reflogs
+                        cmd.extend(_bwrap_binds((
+                            str(main_git / "objects"),
+                            str(main_git / "refs" / "heads"),
+                            str(main_git / "logs" / "refs" / "heads"),
+                        )))
         # Conditionally bind config dirs/files if they exist
-        for config_item in [".claude", ".claude.json", ".anthropic", ".spindle", ".config", ".cache"]:
-            path = f"{home}/{config_item}"
-            if Path(path).exists():
-                cmd.extend(["--bind", path, path])
+        cmd.extend(_bwrap_binds(tuple(f"{home}/{item}" for item in _BWRAP_CONFIG_ITEMS)))
         cmd.extend(claude_cmd)
     else:
         cmd = claude_cmd
 
     # Parse tags
-    tag_list = [t.strip() for t in tags.split(",")] if tags else []
+    tag_list = _parse_tags(tags)
 
     # Create spool record
     spool = {
@@ -1172,21 +2175,7 @@ Your task:
         "harness": "claude-code",
     }
 
-    _write_spool(spool_id, spool)
-
-    # Spawn detached process
-    pid = _spawn_detached(spool_id, cmd, cwd, env)
-
-    # Update spool with PID and status
-    spool["pid"] = pid
-    spool["status"] = "running"
-    _write_spool(spool_id, spool)
-
-    # Start background monitor thread (daemon so it won't block shutdown)
-    monitor = threading.Thread(target=_monitor_spool, args=(spool_id,), daemon=True)
-    monitor.start()
-
-    return spool_id
+    return _start_spool(spool, cmd, cwd, env)
 
 
 @mcp.tool()
@@ -1203,6 +2192,7 @@ async def spin(
     skeinless: bool = False,
     harness: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
+    wait: bool = False,
 ) -> str:
     """
     Spawn an agent to handle a task. Returns immediately with spool_id.
@@ -1224,6 +2214,8 @@ async def spin(
         skeinless: Skip SKEIN context injection for shard agents (default: False)
         harness: Which harness to use - "claude-code" (default), "codex", or "gemini"
         env: Optional dict of environment variables to set in spawned agent
+        wait: If all concurrent slots are taken, wait for one to free up instead of
+              returning an error (default: False)
 
     Returns:
         spool_id to check result later
@@ -1261,6 +2253,7 @@ async def spin(
             timeout,
             tags,
             env,
+            wait,
         )
     elif harness_lower == "gemini":
         return await asyncio.to_thread(
@@ -1272,6 +2265,7 @@ async def spin(
             timeout,
             tags,
             env,
+            wait,
         )
     else:
         # Default to Claude Code harness
@@ -1288,6 +2282,7 @@ async def spin(
             timeout,
             skeinless,
             env,
+            wait,
         )
 
 
@@ -1345,7 +2340,7 @@ def _spools_sync() -> str:
     """Synchronous implementation of spools."""
     _recover_orphans()
     all_spools = _list_spools()
-    return json.dumps(
+    return _json_text(
         {
             spool["id"]: {
                 "status": spool.get("status"),
@@ -1354,55 +2349,93 @@ def _spools_sync() -> str:
                 "session_id": spool.get("session_id"),
             }
             for spool in all_spools
-        },
-        indent=2,
+        }
     )
 
 
 def _spin_drop_sync(spool_id: str) -> str:
     """Synchronous implementation of spin_drop."""
-    spool = _read_spool(spool_id)
-
-    if not spool:
+    # Taking the lock creates a lock file, so don't for ids that don't exist
+    if not _get_spool_path(spool_id).exists():
         return f"Error: Unknown spool_id '{spool_id}'"
 
-    if spool.get("status") != "running":
-        return f"Spool {spool_id} is not running (status: {spool.get('status')})"
+    # Hold the spool lock so a concurrent finalization can't interleave with
+    # this read-modify-write and have one outcome clobber the other
+    with _spool_lock(spool_id):
+        spool = _read_spool(spool_id)
 
-    pid = spool.get("pid")
+        if not spool:
+            return f"Error: Unknown spool_id '{spool_id}'"
 
-    if not pid:
-        return f"Spool {spool_id} has no PID recorded yet"
+        if spool.get("status") != "running":
+            return f"Spool {spool_id} is not running (status: {spool.get('status')})"
 
-    # Kill the process group (since we used start_new_session)
-    try:
-        os.killpg(pid, signal.SIGTERM)
-    except ProcessLookupError:
-        pass  # Already dead
-    except OSError:
-        # Try killing just the process
-        try:
-            os.kill(pid, signal.SIGTERM)
-        except (ProcessLookupError, OSError):
-            pass
+        pid = spool.get("pid")
 
-    # Update spool status
-    spool["status"] = "error"
-    spool["error"] = "Cancelled by user"
-    spool["completed_at"] = datetime.now().isoformat()
-    _write_spool(spool_id, spool)
+        if not pid:
+            return f"Spool {spool_id} has no PID recorded yet"
+
+        # Kill the process group (since we used start_new_session)
+        _signal_process(pid, signal.SIGTERM)
+        _reap_pid(pid, timeout=0.5)
+
+        # Update spool status
+        spool["status"] = "error"
+        spool["error"] = "Cancelled by user"
+        spool["completed_at"] = datetime.now().isoformat()
+        _write_spool(spool_id, spool)
 
     # Clean up output files
-    stdout_path = _get_output_path(spool_id)
-    stderr_path = _get_stderr_path(spool_id)
-    if stdout_path.exists():
-        stdout_path.unlink()
-    if stderr_path.exists():
-        stderr_path.unlink()
+    _get_output_path(spool_id).unlink(missing_ok=True)
+    _get_stderr_path(spool_id).unlink(missing_ok=True)
 
     return f"Dropped spool {spool_id}"
 
 
+# Read size when tailing output backwards from the end of the file
+_TAIL_BLOCK = 64 * 1024
+
+
+def _tail_lines(path: Path, n: int) -> tuple[list[str], int]:
+    """
+    Last n lines of a text file and its total line count.
+
+    Same lines as open(path).readlines()[-n:], but only the end of the file
+    is decoded: newlines are counted a block at a time, then blocks are read
+    back from EOF until they hold n whole lines.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        total = 0
+        remaining = size
+        last = b""
+        while remaining:
+            block = f.read(min(_TAIL_BLOCK, remaining))
+            if not block:
+                break
+            total += block.count(b"\n")
+            remaining -= len(block)
+            last = block[-1:]
+        size -= remaining
+        if size and last != b"\n":
+            total += 1
+
+        start = size
+        buf = b""
+        while start and (n <= 0 or buf.count(b"\n") <= n):
+            step = min(_TAIL_BLOCK, start)
+            start -= step
+            f.seek(start)
+            buf = f.read(step) + buf
+
+    if start:
+        # The first line read is cut off by the block boundary, possibly
+        # mid-character: drop it before decoding
+        buf = buf[buf.index(b"\n") + 1:]
+    tail = io.TextIOWrapper(io.BytesIO(buf)).readlines()
+    return (tail[-n:] if len(tail) > n else tail), total
+
+
 def _spool_peek_sync(spool_id: str, lines: int = 50) -> str:
     """Synchronous implementation of spool_peek."""
     spool = _read_spool(spool_id)
@@ -1414,17 +2447,14 @@ def _spool_peek_sync(spool_id: str, lines: int = 50) -> str:
         return f"No output yet for spool {spool_id}"
 
     try:
-        with open(stdout_path, "r") as f:
-            all_lines = f.readlines()
+        tail, total = _tail_lines(stdout_path, lines)
 
-        if not all_lines:
+        if not total:
             return f"Output file exists but is empty for spool {spool_id}"
 
-        # Get last N lines
-        tail = all_lines[-lines:] if len(all_lines) > lines else all_lines
         status = spool.get("status", "unknown")
 
-        header = f"[spool {spool_id} - {status} - {len(all_lines)} total lines, showing last {len(tail)}]\n"
+        header = f"[spool {spool_id} - {status} - {total} total lines, showing last {len(tail)}]\n"
         return header + "".join(tail)
     except Exception as e:
         return f"Error reading output: {e}"
@@ -1449,13 +2479,13 @@ def _spin_wait_sync(
         time_module.sleep(duration_seconds)
         elapsed = int((datetime.now() - start_time).total_seconds())
 
-        return json.dumps({
+        return _json_text({
             "waited": time_param,
             "elapsed_seconds": elapsed,
             "interrupted": False,
             "started_at": start_time.isoformat(),
             "ended_at": datetime.now().isoformat(),
-        }, indent=2)
+        })
 
     # Must have spool_ids for spool-waiting mode
     if not spool_ids:
@@ -1465,9 +2495,21 @@ def _spin_wait_sync(
     start_time = datetime.now()
     poll_interval = 3  # seconds
 
+    # Between checks, block on the pidfds of children we spawned so an exit
+    # is noticed at once. A pidfd stays readable after its process exits, so
+    # each PID is only waited on until it has fired once.
+    exited: set[int] = set()
+
+    def wait_for_change(pids: list[int]) -> None:
+        delay = poll_interval
+        if timeout:
+            delay = min(delay, max(0.0, timeout - (datetime.now() - start_time).total_seconds()))
+        exited.update(_wait_for_exit([pid for pid in pids if pid not in exited], delay))
+
     if mode == "yield":
         # Return as soon as any completes
         while True:
+            pids = []
             for spool_id in ids:
                 _check_and_finalize_spool(spool_id)
                 spool = _read_spool(spool_id)
@@ -1477,19 +2519,22 @@ def _spin_wait_sync(
                     return spool.get("result", "No result")
                 elif spool.get("status") == "error":
                     return f"Error: {spool.get('error')}"
+                if spool.get("pid"):
+                    pids.append(spool["pid"])
 
             if timeout:
                 elapsed = (datetime.now() - start_time).total_seconds()
                 if elapsed >= timeout:
                     return f"Timeout after {timeout}s. Spools still running: {', '.join(ids)}"
 
-            time_module.sleep(poll_interval)
+            wait_for_change(pids)
     else:
         # gather mode - wait for all
         results = {}
         pending = set(ids)
 
         while pending:
+            pids = []
             for spool_id in list(pending):
                 _check_and_finalize_spool(spool_id)
                 spool = _read_spool(spool_id)
@@ -1501,6 +2546,8 @@ def _spin_wait_sync(
                 elif spool.get("status") == "error":
                     results[spool_id] = f"Error: {spool.get('error')}"
                     pending.remove(spool_id)
+                elif spool.get("pid"):
+                    pids.append(spool["pid"])
 
             if not pending:
                 break
@@ -1510,9 +2557,9 @@ def _spin_wait_sync(
                 if elapsed >= timeout:
                     return f"Timeout after {timeout}s. Still pending: {', '.join(pending)}. Completed: {json.dumps(results)}"
 
-            time_module.sleep(poll_interval)
+            wait_for_change(pids)
 
-        return json.dumps(results, indent=2)
+        return _json_text(results)
 
 
 @mcp.tool()
@@ -1528,7 +2575,7 @@ async def spools() -> str:
     return await asyncio.to_thread(_spools_sync)
 
 
-def _respin_sync(session_id: str, prompt: str) -> str:
+def _respin_sync(session_id: str, prompt: str, wait: bool = False) -> str:
     """Synchronous implementation of respin - auto-detects harness."""
     # Find the original spool to detect harness
     original_spool = _find_spool_by_session(session_id)
@@ -1539,14 +2586,14 @@ def _respin_sync(session_id: str, prompt: str) -> str:
 
     # Route to appropriate harness implementation
     if harness == "codex":
-        return _codex_respin_sync(session_id, prompt)
+        return _codex_respin_sync(session_id, prompt, wait)
     else:
         # Claude Code harness (default)
         # Generate spool ID first
         spool_id = str(uuid.uuid4())[:8]
 
         # Atomically check concurrency limit and create initial spool entry
-        success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending")
+        success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending", wait=wait)
         if not success:
             return error_msg
 
@@ -1554,7 +2601,7 @@ def _respin_sync(session_id: str, prompt: str) -> str:
 
         # Try to resume with session_id first
         # If that fails (session expired), fall back to transcript injection
-        cmd = ["claude", "-p", prompt, "--resume", session_id, "--output-format", "json"]
+        cmd = _claude_cmd(prompt, resume=session_id)
 
         cwd = os.getcwd()
 
@@ -1586,26 +2633,14 @@ def _respin_sync(session_id: str, prompt: str) -> str:
             "harness": "claude-code",
         }
 
-        _write_spool(spool_id, spool)
-
-        # Spawn detached process
-        pid = _spawn_detached(spool_id, cmd, cwd, env)
-
-        spool["pid"] = pid
-        spool["status"] = "running"
-        _write_spool(spool_id, spool)
-
-        # Start background monitor
-        monitor = threading.Thread(target=_monitor_spool, args=(spool_id,), daemon=True)
-        monitor.start()
-
-        return spool_id
+        return _start_spool(spool, cmd, cwd, env)
 
 
 @mcp.tool()
 async def respin(
     session_id: str,
     prompt: str,
+    wait: bool = False,
 ) -> str:
     """
     Continue an existing Claude Code session with a new message.
@@ -1617,11 +2652,13 @@ async def respin(
     Args:
         session_id: The session ID to continue
         prompt: The follow-up message/task
+        wait: If all concurrent slots are taken, wait for one to free up instead of
+              returning an error (default: False)
 
     Returns:
         spool_id to check result later
     """
-    return await asyncio.to_thread(_respin_sync, session_id, prompt)
+    return await asyncio.to_thread(_respin_sync, session_id, prompt, wait)
 
 
 @mcp.tool()
@@ -1658,36 +2695,29 @@ async def spin_wait(
             return f"Error: Invalid time format '{time}'. Use: 30s, 90m, 2h, or HH:MM"
 
         start_time = datetime.now()
-        target_time = start_time + timedelta(seconds=duration_seconds)
-
-        # Sleep in chunks to allow interruption
-        chunk_size = 5  # seconds
-        elapsed = 0
 
+        # One timer for the whole wait; cancellation interrupts it directly
         try:
-            while elapsed < duration_seconds:
-                remaining = duration_seconds - elapsed
-                sleep_time = min(chunk_size, remaining)
-                await asyncio.sleep(sleep_time)
-                elapsed = int((datetime.now() - start_time).total_seconds())
+            await asyncio.sleep(duration_seconds)
+            elapsed = int((datetime.now() - start_time).total_seconds())
         except asyncio.CancelledError:
             # Handle Ctrl+C gracefully
             elapsed = int((datetime.now() - start_time).total_seconds())
-            return json.dumps({
+            return _json_text({
                 "waited": time,
                 "elapsed_seconds": elapsed,
                 "interrupted": True,
                 "started_at": start_time.isoformat(),
                 "ended_at": datetime.now().isoformat(),
-            }, indent=2)
+            })
 
-        return json.dumps({
+        return _json_text({
             "waited": time,
             "elapsed_seconds": elapsed,
             "interrupted": False,
             "started_at": start_time.isoformat(),
             "ended_at": datetime.now().isoformat(),
-        }, indent=2)
+        })
 
     # Must have spool_ids for spool-waiting mode
     if not spool_ids:
@@ -1697,10 +2727,81 @@ async def spin_wait(
     start_time = datetime.now()
     poll_interval = 3  # seconds
 
+    # Between checks, watch the pidfds of children we spawned from the event
+    # loop so an exit is noticed at once; each PID only until it fires
+    exited: set[int] = set()
+
+    # Spools finalized in this process (by the supervisor or another tool)
+    # are reported straight away; spools owned by other processes still rely
+    # on the interval re-check
+    loop = asyncio.get_running_loop()
+    finished = asyncio.Event()
+    notified: set[str] = set()
+    watched = set(ids)
+
+    def notify(spool_id: str) -> None:
+        notified.add(spool_id)
+        finished.set()
+
+    def on_done(spool_id: str) -> None:
+        if spool_id in watched:
+            loop.call_soon_threadsafe(notify, spool_id)
+
+    async def wait_for_change(pids: dict[str, int]) -> Optional[set[str]]:
+        delay = poll_interval
+        if timeout:
+            delay = min(delay, max(0.0, timeout - (datetime.now() - start_time).total_seconds()))
+        if not finished.is_set():
+            by_pid = {pid: spool_id for spool_id, pid in pids.items() if pid not in exited}
+            exit_wait = asyncio.ensure_future(_wait_for_exit_async(list(by_pid), delay))
+            done_wait = asyncio.ensure_future(finished.wait())
+            try:
+                await asyncio.wait({exit_wait, done_wait}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                done_wait.cancel()
+                exit_wait.cancel()
+            if exit_wait.done() and not exit_wait.cancelled():
+                for pid in exit_wait.result():
+                    exited.add(pid)
+                    notified.add(by_pid[pid])
+        finished.clear()
+        # Nothing reported means the interval ran out: re-check everything
+        if not notified:
+            return None
+        changed = set(notified)
+        notified.clear()
+        return changed
+
+    with _SPOOL_DONE_LOCK:
+        _SPOOL_DONE_LISTENERS.add(on_done)
+    try:
+        return await _wait_for_spools(ids, mode, timeout, start_time, wait_for_change)
+    finally:
+        with _SPOOL_DONE_LOCK:
+            _SPOOL_DONE_LISTENERS.discard(on_done)
+
+
+async def _wait_for_spools(
+    ids: list[str],
+    mode: str,
+    timeout: Optional[int],
+    start_time: datetime,
+    wait_for_change: Callable,
+) -> str:
+    """
+    Check loop behind spin_wait.
+
+    wait_for_change(pids) sleeps until something may have finished and
+    returns the spool IDs to look at, or None to re-check every spool; only
+    those are re-read, so one finishing spool doesn't rescan the rest.
+    """
+    pids: dict[str, int] = {}
+
     if mode == "yield":
         # Return as soon as any completes
+        to_check = ids
         while True:
-            for spool_id in ids:
+            for spool_id in to_check:
                 _check_and_finalize_spool(spool_id)
                 spool = _read_spool(spool_id)
                 if not spool:
@@ -1709,20 +2810,24 @@ async def spin_wait(
                     return spool.get("result", "No result")
                 elif spool.get("status") == "error":
                     return f"Error: {spool.get('error')}"
+                if spool.get("pid"):
+                    pids[spool_id] = spool["pid"]
 
             if timeout:
                 elapsed = (datetime.now() - start_time).total_seconds()
                 if elapsed >= timeout:
                     return f"Timeout after {timeout}s. Spools still running: {', '.join(ids)}"
 
-            await asyncio.sleep(poll_interval)
+            changed = await wait_for_change(pids)
+            to_check = ids if changed is None else [spool_id for spool_id in ids if spool_id in changed]
     else:
         # gather mode - wait for all
         results = {}
         pending = set(ids)
+        to_check = set(pending)
 
         while pending:
-            for spool_id in list(pending):
+            for spool_id in to_check:
                 _check_and_finalize_spool(spool_id)
                 spool = _read_spool(spool_id)
                 if not spool:
@@ -1730,9 +2835,13 @@ async def spin_wait(
                 if spool.get("status") == "complete":
                     results[spool_id] = spool.get("result", "No result")
                     pending.remove(spool_id)
+                    pids.pop(spool_id, None)
                 elif spool.get("status") == "error":
                     results[spool_id] = f"Error: {spool.get('error')}"
                     pending.remove(spool_id)
+                    pids.pop(spool_id, None)
+                elif spool.get("pid"):
+                    pids[spool_id] = spool["pid"]
 
             if not pending:
                 break
@@ -1742,9 +2851,10 @@ async def spin_wait(
                 if elapsed >= timeout:
                     return f"Timeout after {timeout}s. Still pending: {', '.join(pending)}. Completed: {json.dumps(results)}"
 
-            await asyncio.sleep(poll_interval)
+            changed = await wait_for_change(pids)
+            to_check = set(pending) if changed is None else pending & changed
 
-        return json.dumps(results, indent=2)
+        return _json_text(results)
 
 
 @mcp.tool()
@@ -1773,36 +2883,29 @@ async def spin_sleep(duration: str) -> str:
         return f"Error: Invalid duration format '{duration}'. Use: 30s, 90m, 2h, or HH:MM"
 
     start_time = datetime.now()
-    target_time = start_time + timedelta(seconds=duration_seconds)
-
-    # Sleep in chunks to allow interruption
-    chunk_size = 5  # seconds
-    elapsed = 0
 
+    # One timer for the whole wait; cancellation interrupts it directly
     try:
-        while elapsed < duration_seconds:
-            remaining = duration_seconds - elapsed
-            sleep_time = min(chunk_size, remaining)
-            await asyncio.sleep(sleep_time)
-            elapsed = int((datetime.now() - start_time).total_seconds())
+        await asyncio.sleep(duration_seconds)
+        elapsed = int((datetime.now() - start_time).total_seconds())
     except asyncio.CancelledError:
         # Handle Ctrl+C gracefully
         elapsed = int((datetime.now() - start_time).total_seconds())
-        return json.dumps({
+        return _json_text({
             "duration": duration,
             "elapsed_seconds": elapsed,
             "interrupted": True,
             "started_at": start_time.isoformat(),
             "ended_at": datetime.now().isoformat(),
-        }, indent=2)
+        })
 
-    return json.dumps({
+    return _json_text({
         "duration": duration,
         "elapsed_seconds": elapsed,
         "interrupted": False,
         "started_at": start_time.isoformat(),
         "ended_at": datetime.now().isoformat(),
-    }, indent=2)
+    })
 
 
 @mcp.tool()
@@ -1816,84 +2919,39 @@ async def spin_drop(spool_id: str) -> str:
     Returns:
         Success or error message
     """
-    spool = _read_spool(spool_id)
-
-    if not spool:
-        return f"Error: Unknown spool_id '{spool_id}'"
-
-    if spool.get("status") != "running":
-        return f"Spool {spool_id} is not running (status: {spool.get('status')})"
-
-    pid = spool.get("pid")
-
-    if not pid:
-        return f"Spool {spool_id} has no PID recorded yet"
-
-    # Kill the process group (since we used start_new_session)
-    try:
-        os.killpg(pid, signal.SIGTERM)
-    except ProcessLookupError:
-        pass  # Already dead
-    except OSError:
-        # Try killing just the process
-        try:
-            os.kill(pid, signal.SIGTERM)
-        except (ProcessLookupError, OSError):
-            pass
-
-    # Update spool status
-    spool["status"] = "error"
-    spool["error"] = "Cancelled by user"
-    spool["completed_at"] = datetime.now().isoformat()
-    _write_spool(spool_id, spool)
-
-    # Clean up output files
-    stdout_path = _get_output_path(spool_id)
-    stderr_path = _get_stderr_path(spool_id)
-    if stdout_path.exists():
-        stdout_path.unlink()
-    if stderr_path.exists():
-        stderr_path.unlink()
-
-    return f"Dropped spool {spool_id}"
+    return await asyncio.to_thread(_spin_drop_sync, spool_id)
 
 
-@mcp.tool()
-async def spool_search(
+def _spool_search_sync(
     query: str,
     field: str = "both",
+    limit: Optional[int] = None,
 ) -> str:
-    """
-    Search spool prompts and/or results for a string.
-
-    Args:
-        query: The search string (case-insensitive)
-        field: Where to search - "prompt", "result", or "both" (default)
-
-    Returns:
-        Matching spool IDs with context snippets
-
-    Example:
-        spool_search("triage")              # search both
-        spool_search("human review", field="result")  # results only
-    """
-    all_spools = _list_spools()
+    """Synchronous implementation of spool_search."""
     matches = []
     query_lower = query.lower()
-
-    for spool in all_spools:
+    # Locates snippets in the original text; lower() can change string
+    # length, so offsets found in the lowercased copy may not line up
+    query_pattern = _compile_regex(re.escape(query))
+    search_prompt = field in ("prompt", "both")
+    search_result = field in ("result", "both")
+
+    for entry in _list_spool_entries():
+        if limit is not None and len(matches) >= limit:
+            break
+        spool = entry["spool"]
         spool_id = spool.get("id", "unknown")
-        prompt = spool.get("prompt", "") or ""
-        result = spool.get("result", "") or ""
-
-        # Convert result to string if it's a dict
-        if isinstance(result, dict):
-            result = json.dumps(result)
 
-        prompt_match = query_lower in prompt.lower() if field in ("prompt", "both") else False
-        result_match = query_lower in result.lower() if field in ("result", "both") else False
+        # Lowercased text is memoized per spool version in the index
+        prompt_idx = result_idx = -1
+        if search_prompt:
+            prompt, prompt_lower = _spool_text(entry, "prompt")
+            prompt_idx = prompt_lower.find(query_lower)
+        if search_result:
+            result, result_lower = _spool_text(entry, "result")
+            result_idx = result_lower.find(query_lower)
 
-        if prompt_match or result_match:
+        if prompt_idx >= 0 or result_idx >= 0:
             match_info = {
                 "id": spool_id,
                 "status": spool.get("status"),
@@ -1901,16 +2959,18 @@ async def spool_search(
             }
 
             # Add context snippets
-            if prompt_match:
-                idx = prompt.lower().find(query_lower)
+            if prompt_idx >= 0:
+                m = query_pattern.search(prompt)
+                idx, match_end = (m.start(), m.end()) if m else (prompt_idx, prompt_idx + len(query))
                 start = max(0, idx - 30)
-                end = min(len(prompt), idx + len(query) + 30)
+                end = min(len(prompt), match_end + 30)
                 match_info["prompt_match"] = f"...{prompt[start:end]}..."
 
-            if result_match:
-                idx = result.lower().find(query_lower)
+            if result_idx >= 0:
+                m = query_pattern.search(result)
+                idx, match_end = (m.start(), m.end()) if m else (result_idx, result_idx + len(query))
                 start = max(0, idx - 50)
-                end = min(len(result), idx + len(query) + 50)
+                end = min(len(result), match_end + 50)
                 match_info["result_match"] = f"...{result[start:end]}..."
 
             matches.append(match_info)
@@ -1918,50 +2978,51 @@ async def spool_search(
     if not matches:
         return f"No spools found matching '{query}' in {field}"
 
-    return json.dumps(matches, indent=2)
+    return _json_text(matches)
 
 
 @mcp.tool()
-async def spool_results(
-    status: str = "complete",
-    since: Optional[str] = None,
-    limit: int = 10,
+async def spool_search(
+    query: str,
+    field: str = "both",
+    limit: Optional[int] = None,
 ) -> str:
     """
-    Bulk fetch spool results with filtering.
+    Search spool prompts and/or results for a string.
 
     Args:
-        status: Filter by status - "complete", "error", "running", or "all" (default: complete)
-        since: Time filter - "1h", "6h", "1d", "7d" (default: no filter)
-        limit: Max results to return (default: 10)
+        query: The search string (case-insensitive)
+        field: Where to search - "prompt", "result", or "both" (default)
+        limit: Stop after this many matches (default: no limit)
 
     Returns:
-        List of spool results matching filters
+        Matching spool IDs with context snippets
 
     Example:
-        spool_results()                      # last 10 completed
-        spool_results(status="error")        # failed spools
-        spool_results(since="1h")            # last hour
+        spool_search("triage")              # search both
+        spool_search("human review", field="result")  # results only
+        spool_search("error", limit=5)      # first 5 matches
     """
-    all_spools = _list_spools()
-    now = datetime.now()
+    return await asyncio.to_thread(_spool_search_sync, query, field, limit)
+
 
+def _spool_results_sync(
+    status: str = "complete",
+    since: Optional[str] = None,
+    limit: int = 10,
+) -> str:
+    """Synchronous implementation of spool_results."""
     # Parse since filter
     since_cutoff = None
     if since:
-        since_map = {
-            "1h": timedelta(hours=1),
-            "6h": timedelta(hours=6),
-            "12h": timedelta(hours=12),
-            "1d": timedelta(days=1),
-            "7d": timedelta(days=7),
-        }
-        delta = since_map.get(since)
+        delta = SINCE_WINDOWS.get(since)
         if delta:
-            since_cutoff = now - delta
+            since_cutoff = datetime.now() - delta
         else:
             return f"Invalid since value '{since}'. Use: 1h, 6h, 12h, 1d, 7d"
 
+    all_spools = _list_spools()
+
     # Filter spools
     filtered = []
     for spool in all_spools:
@@ -1974,7 +3035,7 @@ async def spool_results(
             created_str = spool.get("created_at")
             if created_str:
                 try:
-                    created = datetime.fromisoformat(created_str)
+                    created = _parse_timestamp(created_str)
                     if created < since_cutoff:
                         continue
                 except ValueError:
@@ -1982,11 +3043,8 @@ async def spool_results(
 
         filtered.append(spool)
 
-    # Sort by created_at descending
-    filtered.sort(key=lambda s: s.get("created_at", ""), reverse=True)
-
-    # Apply limit
-    filtered = filtered[:limit]
+    # Newest `limit` spools by created_at, without sorting the rest
+    filtered = heapq.nlargest(limit, filtered, key=lambda s: s.get("created_at", ""))
 
     # Format output
     results = []
@@ -2009,58 +3067,205 @@ async def spool_results(
     if not results:
         return f"No spools found with status='{status}'" + (f" since {since}" if since else "")
 
-    return json.dumps(results, indent=2)
+    return _json_text(results)
 
 
 @mcp.tool()
-async def spool_grep(pattern: str) -> str:
+async def spool_results(
+    status: str = "complete",
+    since: Optional[str] = None,
+    limit: int = 10,
+) -> str:
     """
-    Regex search through all spool results.
+    Bulk fetch spool results with filtering.
 
     Args:
-        pattern: Regular expression pattern to search for
+        status: Filter by status - "complete", "error", "running", or "all" (default: complete)
+        since: Time filter - "1h", "6h", "1d", "7d" (default: no filter)
+        limit: Max results to return (default: 10)
+
+    Returns:
+        List of spool results matching filters
+
+    Example:
+        spool_results()                      # last 10 completed
+        spool_results(status="error")        # failed spools
+        spool_results(since="1h")            # last hour
+    """
+    return await asyncio.to_thread(_spool_results_sync, status, since, limit)
+
+
+def _literal_runs(items: list) -> Optional[list[str]]:
+    """
+    Find literal strings of which at least one must appear in any match of a
+    parsed regex sequence. Returns None when no such literal can be derived.
+    Only ASCII literals are used - their case-insensitive matches are all
+    covered by casefold() (see _grep_fold).
+    """
+    if len(items) == 1:
+        op, av = items[0]
+        if op is _sre_constants.SUBPATTERN:
+            return _literal_runs(list(av[-1]))
+        if op is _sre_constants.BRANCH:
+            # Every alternative must contribute a literal
+            alternatives = []
+            for branch in av[1]:
+                literals = _literal_runs(list(branch))
+                if not literals:
+                    return None
+                alternatives.extend(literals)
+            return alternatives
+
+    # Longest run of consecutive literals in a sequence - all required
+    best = ""
+    run = []
+    for op, av in items + [(None, None)]:
+        if op is _sre_constants.LITERAL and av < 128:
+            run.append(chr(av))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    return [best.casefold()] if best else None
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_regex(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile a search pattern, reusing it across tool calls."""
+    return re.compile(pattern, flags)
+
+
+# Wall-clock budget for one spool_grep call when the regex module is available.
+# Plain re can't be interrupted, so a catastrophically backtracking pattern
+# would otherwise hold the tool until it finishes.
+_GREP_TIMEOUT = 2.0
+
+# Errors raised for a pattern that doesn't compile
+_PATTERN_ERRORS = (re.error,) if regex is None else (re.error, regex.error)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_grep(pattern: str) -> Any:
+    """Compile a spool_grep pattern, with the regex module when available."""
+    if regex is not None:
+        return regex.compile(pattern, regex.IGNORECASE | regex.VERSION0)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _grep_literals(pattern: str) -> Optional[tuple[str, ...]]:
+    """Casefolded literal prefilter for a spool_grep pattern, or None."""
+    try:
+        literals = _literal_runs(list(_sre_parse.parse(pattern)))
+    except Exception:
+        return None
+    return tuple(literals) if literals else None
+
+
+def _grep_matches(
+    pattern: Any, texts: str | tuple[str, ...], keep: int = 10, deadline: Optional[float] = None
+) -> tuple[list, int]:
+    """
+    Collect the first `keep` unique matches of pattern in texts, and count all.
+
+    Matches are reported like re.findall does (the group, or a tuple of
+    groups, when the pattern has any), but only the kept ones are built.
+    Passing a time.monotonic() deadline (regex module patterns only) raises
+    TimeoutError once it is exceeded.
+    """
+    if isinstance(texts, str):
+        texts = (texts,)
+    unique: dict = {}
+    count = 0
+    groups = pattern.groups
+    for text in texts:
+        if deadline is None:
+            found = pattern.finditer(text)
+        else:
+            found = pattern.finditer(text, timeout=max(deadline - time.monotonic(), 0.001))
+        for m in found:
+            count += 1
+            if len(unique) < keep:
+                if groups == 0:
+                    item = m.group(0)
+                elif groups == 1:
+                    item = m.group(1) or ""
+                else:
+                    item = m.groups("")
+                unique[item] = None
+    return list(unique), count
+
 
-    Returns:
-        Matching spool IDs with matched text
+def _grep_fold(text: str) -> str:
+    """
+    Fold text for the spool_grep literal prefilter.
 
-    Example:
-        spool_grep("friction-[0-9]+-[a-z]+")    # find friction IDs in results
-        spool_grep("error|failed|exception")    # find error-related text
+    casefold() covers every character re.IGNORECASE treats as equal to an
+    ASCII letter except dotless i, which is mapped explicitly.
     """
+    return text.casefold().replace("\u0131", "i")
+
+
+def _spool_grep_sync(pattern: str) -> str:
+    """Synchronous implementation of spool_grep."""
     try:
-        regex = re.compile(pattern, re.IGNORECASE)
-    except re.error as e:
+        compiled = _compile_grep(pattern)
+    except _PATTERN_ERRORS as e:
         return f"Invalid regex pattern: {e}"
+    deadline = time.monotonic() + _GREP_TIMEOUT if regex is not None else None
+
+    # Literals any match must contain: skip spools without them cheaply.
+    # They come from re's parser, which reads some patterns differently from
+    # the regex module (e.g. POSIX classes), so only trust them when re matches.
+    literals = None if regex is not None else _grep_literals(pattern)
 
-    all_spools = _list_spools()
     matches = []
 
-    for spool in all_spools:
+    for entry in _list_spool_entries():
+        spool = entry["spool"]
         spool_id = spool.get("id", "unknown")
-        result = spool.get("result", "") or ""
+        texts, folded = _grep_text(entry)
 
-        # Convert result to string if it's a dict
-        if isinstance(result, dict):
-            result = json.dumps(result)
+        if literals is not None and not any(literal in folded for literal in literals):
+            continue
 
-        found = regex.findall(result)
-        if found:
-            # Get unique matches and limit to first 10
-            unique_matches = list(dict.fromkeys(found))[:10]
+        try:
+            unique_matches, match_count = _grep_matches(compiled, texts, deadline=deadline)
+        except TimeoutError:
+            return f"Pattern '{pattern}' took longer than {_GREP_TIMEOUT:g}s to match; try a more specific pattern"
+        if match_count:
             matches.append(
                 {
                     "id": spool_id,
                     "status": spool.get("status"),
                     "prompt": spool.get("prompt", "")[:80],
                     "matches": unique_matches,
-                    "match_count": len(found),
+                    "match_count": match_count,
                 }
             )
 
     if not matches:
         return f"No results matching pattern '{pattern}'"
 
-    return json.dumps(matches, indent=2)
+    return _json_text(matches)
+
+
+@mcp.tool()
+async def spool_grep(pattern: str) -> str:
+    """
+    Regex search through all spool results.
+
+    Args:
+        pattern: Regular expression pattern to search for
+
+    Returns:
+        Matching spool IDs with matched text
+
+    Example:
+        spool_grep("friction-[0-9]+-[a-z]+")    # find friction IDs in results
+        spool_grep("error|failed|exception")    # find error-related text
+    """
+    return await asyncio.to_thread(_spool_grep_sync, pattern)
 
 
 @mcp.tool()
@@ -2081,29 +3286,7 @@ async def spool_peek(spool_id: str, lines: int = 50) -> str:
         spool_peek("abc123")          # see last 50 lines
         spool_peek("abc123", lines=100)  # see last 100 lines
     """
-    spool = _read_spool(spool_id)
-    if not spool:
-        return f"Error: Unknown spool_id '{spool_id}'"
-
-    stdout_path = _get_output_path(spool_id)
-    if not stdout_path.exists():
-        return f"No output yet for spool {spool_id}"
-
-    try:
-        with open(stdout_path, "r") as f:
-            all_lines = f.readlines()
-
-        if not all_lines:
-            return f"Output file exists but is empty for spool {spool_id}"
-
-        # Get last N lines
-        tail = all_lines[-lines:] if len(all_lines) > lines else all_lines
-        status = spool.get("status", "unknown")
-
-        header = f"[spool {spool_id} - {status} - {len(all_lines)} total lines, showing last {len(tail)}]\n"
-        return header + "".join(tail)
-    except Exception as e:
-        return f"Error reading output: {e}"
+    return await asyncio.to_thread(_spool_peek_sync, spool_id, lines)
 
 
 @mcp.tool()
@@ -2207,21 +3390,14 @@ def _get_shard_commit_status(spool: dict) -> Optional[str]:
         return "no_worktree"
 
     try:
-        # Check for uncommitted changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=worktree_path, timeout=10
-        )
-        has_uncommitted = bool(result.stdout.strip()) if result.returncode == 0 else False
-
-        # Check for commits ahead of master
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "master..HEAD"],
-            capture_output=True,
-            text=True,
+        # Check for uncommitted changes and commits ahead of master together
+        status, ahead = _run_concurrently(
+            [["git", "status", "--porcelain"], ["git", "rev-list", "--count", "master..HEAD"]],
             cwd=worktree_path,
             timeout=10,
         )
-        commits_ahead = int(result.stdout.strip()) if result.returncode == 0 else 0
+        has_uncommitted = bool(status.stdout.strip()) if status.returncode == 0 else False
+        commits_ahead = int(ahead.stdout.strip()) if ahead.returncode == 0 else 0
 
         if has_uncommitted:
             return "uncommitted"
@@ -2311,6 +3487,13 @@ def _get_shard_change_stats(spool: dict) -> Optional[dict]:
         return None
 
 
+def _dashboard_shard_info(spool: dict) -> tuple[Optional[str], Optional[dict]]:
+    """Commit status of a completed shard, plus change stats when it has commits."""
+    commit_status = _get_shard_commit_status(spool)
+    stats = _get_shard_change_stats(spool) if commit_status == "has_commit" else None
+    return commit_status, stats
+
+
 def _spool_dashboard_sync() -> str:
     """Synchronous implementation of spool_dashboard."""
     _recover_orphans()
@@ -2333,15 +3516,28 @@ def _spool_dashboard_sync() -> str:
             completed_at = spool.get("completed_at")
             if completed_at:
                 try:
-                    completed_dt = datetime.fromisoformat(completed_at)
+                    completed_dt = _parse_timestamp(completed_at)
                     if completed_dt >= hour_ago:
                         complete_last_hour.append(spool)
                 except ValueError:
                     pass
 
+    # Each completed shard costs several git calls; run them once per shard,
+    # side by side, and share the answers between the two sections below
+    recent_spools = sorted(complete_last_hour, key=lambda s: s.get("completed_at", ""), reverse=True)[:10]
+    shards = [
+        spool for spool in all_spools
+        if spool.get("status") == "complete" and spool.get("shard")
+    ]
+    shard_info_by_id = {}
+    if shards:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="spindle-dashboard") as pool:
+            for spool, info in zip(shards, pool.map(_dashboard_shard_info, shards)):
+                shard_info_by_id[spool.get("id")] = info
+
     # Build recent completions list (last hour, sorted by completion time)
     recent = []
-    for spool in sorted(complete_last_hour, key=lambda s: s.get("completed_at", ""), reverse=True)[:10]:
+    for spool in recent_spools:
         spool_id = spool.get("id")
         completed_at = spool.get("completed_at")
 
@@ -2349,7 +3545,7 @@ def _spool_dashboard_sync() -> str:
         age_str = "unknown"
         if completed_at:
             try:
-                completed_dt = datetime.fromisoformat(completed_at)
+                completed_dt = _parse_timestamp(completed_at)
                 age_mins = int((now - completed_dt).total_seconds() / 60)
                 age_str = f"{age_mins}m ago"
             except ValueError:
@@ -2360,7 +3556,7 @@ def _spool_dashboard_sync() -> str:
         if len(spool.get("prompt", "")) > 60:
             prompt += "..."
 
-        commit_status = _get_shard_commit_status(spool)
+        commit_status = shard_info_by_id.get(spool_id, (None, None))[0]
 
         recent.append(
             {
@@ -2382,7 +3578,7 @@ def _spool_dashboard_sync() -> str:
         if not shard_info:
             continue
 
-        commit_status = _get_shard_commit_status(spool)
+        commit_status, stats = shard_info_by_id[spool.get("id")]
         needs_attention = False
         reason = None
 
@@ -2395,7 +3591,6 @@ def _spool_dashboard_sync() -> str:
 
         # Check for large changes
         if commit_status == "has_commit":
-            stats = _get_shard_change_stats(spool)
             if stats:
                 total_changes = stats.get("insertions", 0) + stats.get("deletions", 0)
                 if total_changes > 500 or stats.get("files_changed", 0) > 10:
@@ -2418,7 +3613,7 @@ def _spool_dashboard_sync() -> str:
         created_at = spool.get("created_at")
         if created_at:
             try:
-                created_dt = datetime.fromisoformat(created_at)
+                created_dt = _parse_timestamp(created_at)
                 if created_dt >= hour_ago:
                     needing_attention.append(
                         {
@@ -2450,7 +3645,7 @@ def _spool_dashboard_sync() -> str:
         "needing_attention": needing_attention,
     }
 
-    return json.dumps(dashboard, indent=2)
+    return _json_text(dashboard)
 
 
 @mcp.tool()
@@ -2481,63 +3676,38 @@ async def spool_dashboard() -> str:
     return await asyncio.to_thread(_spool_dashboard_sync)
 
 
-@mcp.tool()
-async def spool_stats() -> str:
-    """
-    Get summary statistics for all spools.
-
-    Returns:
-        JSON with counts by status and time range
-
-    Example:
-        stats = spool_stats()  # {"total": 25, "by_status": {"complete": 10, "error": 2}, ...}
-    """
+def _spool_stats_sync() -> str:
+    """Synchronous implementation of spool_stats."""
     all_spools = _list_spools()
 
+    created = [c for c in (spool.get("created_at") for spool in all_spools) if c]
+
     stats = {
         "total": len(all_spools),
-        "by_status": {},
-        "oldest": None,
-        "newest": None,
+        "by_status": dict(Counter(spool.get("status", "unknown") for spool in all_spools)),
+        "oldest": min(created, default=None),
+        "newest": max(created, default=None),
     }
 
-    for spool in all_spools:
-        # Count by status
-        status = spool.get("status", "unknown")
-        stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-
-        # Track time range
-        created = spool.get("created_at")
-        if created:
-            if not stats["oldest"] or created < stats["oldest"]:
-                stats["oldest"] = created
-            if not stats["newest"] or created > stats["newest"]:
-                stats["newest"] = created
-
-    return json.dumps(stats, indent=2)
+    return _json_text(stats)
 
 
 @mcp.tool()
-async def spool_export(
-    spool_ids: str,
-    format: str = "json",
-    output_path: Optional[str] = None,
-) -> str:
+async def spool_stats() -> str:
     """
-    Export spool results to a file.
-
-    Args:
-        spool_ids: Comma-separated spool IDs, or "all" for all spools
-        format: Output format - "json" or "md" (markdown)
-        output_path: File path to write (default: ~/.spindle/export.{format})
+    Get summary statistics for all spools.
 
     Returns:
-        Path to exported file
+        JSON with counts by status and time range
 
     Example:
-        spool_export("abc123,def456", format="md")
-        spool_export("all", format="json", output_path="/tmp/results.json")
+        stats = spool_stats()  # {"total": 25, "by_status": {"complete": 10, "error": 2}, ...}
     """
+    return await asyncio.to_thread(_spool_stats_sync)
+
+
+def _spool_export_sync(spool_ids: str, format: str = "json", output_path: Optional[str] = None) -> str:
+    """Synchronous implementation of spool_export."""
     # Get spools to export
     if spool_ids.strip().lower() == "all":
         spools_to_export = _list_spools()
@@ -2557,43 +3727,85 @@ async def spool_export(
     # Sort by created_at
     spools_to_export.sort(key=lambda s: s.get("created_at", ""))
 
-    # Generate output
-    if format == "md":
-        lines = ["# Spool Export", "", f"Generated: {datetime.now().isoformat()}", ""]
-        for spool in spools_to_export:
-            lines.append(f"## {spool.get('id')}")
-            lines.append(f"**Status:** {spool.get('status')}")
-            lines.append(f"**Created:** {spool.get('created_at')}")
-            lines.append("")
-            lines.append("### Prompt")
-            lines.append(f"```\n{spool.get('prompt', '')}\n```")
-            lines.append("")
-            lines.append("### Result")
-            result = spool.get("result", "")
-            if isinstance(result, dict):
-                result = json.dumps(result, indent=2)
-            lines.append(f"```\n{result}\n```")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-        content = "\n".join(lines)
-        ext = "md"
-    else:
-        content = json.dumps(spools_to_export, indent=2)
-        ext = "json"
-
-    # Write file
+    ext = "md" if format == "md" else "json"
     if output_path:
         path = Path(output_path)
     else:
         path = SPINDLE_DIR / f"export.{ext}"
-
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+
+    # Write straight to the file, one spool at a time
+    with open(path, "w") as f:
+        if format == "md":
+            f.write(f"# Spool Export\n\nGenerated: {datetime.now().isoformat()}\n")
+            for spool in spools_to_export:
+                result = spool.get("result", "")
+                if isinstance(result, dict):
+                    result = _json_text(result)
+                f.write(
+                    f"\n## {spool.get('id')}\n"
+                    f"**Status:** {spool.get('status')}\n"
+                    f"**Created:** {spool.get('created_at')}\n"
+                    f"\n### Prompt\n```\n{spool.get('prompt', '')}\n```\n"
+                    f"\n### Result\n```\n{result}\n```\n"
+                    f"\n---\n"
+                )
+        else:
+            f.write(_json_text(spools_to_export))
 
     return f"Exported {len(spools_to_export)} spools to {path}"
 
 
+@mcp.tool()
+async def spool_export(
+    spool_ids: str,
+    format: str = "json",
+    output_path: Optional[str] = None,
+) -> str:
+    """
+    Export spool results to a file.
+
+    Args:
+        spool_ids: Comma-separated spool IDs, or "all" for all spools
+        format: Output format - "json" or "md" (markdown)
+        output_path: File path to write (default: ~/.spindle/export.{format})
+
+    Returns:
+        Path to exported file
+
+    Example:
+        spool_export("abc123,def456", format="md")
+        spool_export("all", format="json", output_path="/tmp/results.json")
+    """
+    return await asyncio.to_thread(_spool_export_sync, spool_ids, format, output_path)
+
+
+def _run_concurrently(cmds: list[list[str]], cwd: str, timeout: float) -> list[subprocess.CompletedProcess]:
+    """
+    Run several commands side by side, capturing their text output.
+
+    Like subprocess.run(cmd, capture_output=True, text=True) for each
+    command, but the processes overlap and share one timeout. Raises
+    subprocess.TimeoutExpired, with every process killed, if they are not
+    all done in time.
+    """
+    procs = []
+    try:
+        for cmd in cmds:
+            procs.append(subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True))
+        deadline = time.monotonic() + timeout
+        results = []
+        for cmd, proc in zip(cmds, procs):
+            stdout, stderr = proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
+            results.append(subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr))
+        return results
+    finally:
+        for proc in procs:
+            if proc.returncode is None:
+                proc.kill()
+                proc.communicate()
+
+
 def _shard_status_sync(spool_id: str) -> str:
     """Synchronous implementation of shard_status."""
     spool = _read_spool(spool_id)
@@ -2607,9 +3819,8 @@ def _shard_status_sync(spool_id: str) -> str:
 
     worktree_path = shard_info.get("worktree_path")
     if not worktree_path or not Path(worktree_path).exists():
-        return json.dumps(
-            {"spool_id": spool_id, "shard": shard_info, "exists": False, "message": "Worktree no longer exists"},
-            indent=2,
+        return _json_text(
+            {"spool_id": spool_id, "shard": shard_info, "exists": False, "message": "Worktree no longer exists"}
         )
 
     status_info = {
@@ -2620,26 +3831,22 @@ def _shard_status_sync(spool_id: str) -> str:
     }
 
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"], capture_output=True, text=True, cwd=worktree_path, timeout=10
-        )
-        if result.returncode == 0:
-            status_info["git_changes"] = result.stdout.strip().split("\n") if result.stdout.strip() else []
-
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "master..HEAD"],
-            capture_output=True,
-            text=True,
+        # Independent queries - run both git processes at once
+        status, ahead = _run_concurrently(
+            [["git", "status", "--porcelain"], ["git", "rev-list", "--count", "master..HEAD"]],
             cwd=worktree_path,
             timeout=10,
         )
-        if result.returncode == 0:
-            status_info["commits_ahead"] = int(result.stdout.strip())
+        if status.returncode == 0:
+            status_info["git_changes"] = status.stdout.strip().split("\n") if status.stdout.strip() else []
+
+        if ahead.returncode == 0:
+            status_info["commits_ahead"] = int(ahead.stdout.strip())
 
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError, ValueError):
         status_info["git_error"] = "Failed to get git status"
 
-    return json.dumps(status_info, indent=2)
+    return _json_text(status_info)
 
 
 @mcp.tool()
@@ -2661,27 +3868,8 @@ async def shard_status(spool_id: str) -> str:
     return await asyncio.to_thread(_shard_status_sync, spool_id)
 
 
-@mcp.tool()
-async def shard_merge(spool_id: str, keep_branch: bool = False, caller_cwd: str | None = None) -> str:
-    """
-    Merge a shard's changes back to master and clean up the worktree.
-
-    The spool must be complete (not running). Changes are merged to master
-    using a merge commit.
-
-    Args:
-        spool_id: The spool_id with a shard to merge
-        keep_branch: Keep the branch after merge (default: delete)
-        caller_cwd: Optional current working directory of the caller. If provided
-            and the cwd is inside the worktree, the operation will be refused to
-            prevent breaking the caller's shell.
-
-    Returns:
-        Success or error message
-
-    Example:
-        shard_merge("abc123")  # merge and cleanup
-    """
+def _shard_merge_sync(spool_id: str, keep_branch: bool = False, caller_cwd: str | None = None) -> str:
+    """Synchronous implementation of shard_merge."""
     if not caller_cwd:
         return "Error: caller_cwd required. Pass your current working directory to prevent deleting a worktree you're inside of."
 
@@ -2741,12 +3929,14 @@ async def shard_merge(spool_id: str, keep_branch: bool = False, caller_cwd: str
         if result.returncode != 0:
             return f"Error: Merge failed: {result.stderr}"
 
-        # Cleanup shard
-        _cleanup_shard(shard_info, str(main_repo), keep_branch=keep_branch, spool_id=spool_id)
+        # Remove the worktree now so a failure reaches the caller; only the
+        # branch deletion, which nothing here depends on, runs in the background
+        removed = _cleanup_shard(shard_info, str(main_repo), keep_branch=True, spool_id=spool_id)
+        if removed and not keep_branch and branch_name:
+            _CLEANUP_POOL.submit(_delete_shard_branch, branch_name, str(main_repo), spool_id)
 
         # Update spool record
-        spool["shard"]["merged"] = True
-        spool["shard"]["merged_at"] = datetime.now().isoformat()
+        spool["shard"] = {**spool["shard"], "merged": True, "merged_at": datetime.now().isoformat()}
         _write_spool(spool_id, spool)
 
         # Auto-close any tender folios for this worktree
@@ -2754,6 +3944,8 @@ async def shard_merge(spool_id: str, keep_branch: bool = False, caller_cwd: str
         tender_result = _close_tender_folios(worktree_name, str(main_repo))
 
         msg = f"Successfully merged shard {spool_id} to master"
+        if not removed:
+            msg += f", but failed to remove worktree {worktree_path} (see server log)"
         if tender_result:
             msg += f". {tender_result}"
         return msg
@@ -2765,15 +3957,16 @@ async def shard_merge(spool_id: str, keep_branch: bool = False, caller_cwd: str
 
 
 @mcp.tool()
-async def shard_abandon(spool_id: str, keep_branch: bool = False, caller_cwd: str | None = None) -> str:
+async def shard_merge(spool_id: str, keep_branch: bool = False, caller_cwd: str | None = None) -> str:
     """
-    Abandon a shard, removing the worktree without merging.
+    Merge a shard's changes back to master and clean up the worktree.
 
-    Use this when a shard's work is no longer needed.
+    The spool must be complete (not running). Changes are merged to master
+    using a merge commit.
 
     Args:
-        spool_id: The spool_id with a shard to abandon
-        keep_branch: Keep the branch for later (default: delete)
+        spool_id: The spool_id with a shard to merge
+        keep_branch: Keep the branch after merge (default: delete)
         caller_cwd: Optional current working directory of the caller. If provided
             and the cwd is inside the worktree, the operation will be refused to
             prevent breaking the caller's shell.
@@ -2782,8 +3975,15 @@ async def shard_abandon(spool_id: str, keep_branch: bool = False, caller_cwd: st
         Success or error message
 
     Example:
-        shard_abandon("abc123")  # discard shard
+        shard_merge("abc123")  # merge and cleanup
     """
+    import asyncio
+
+    return await asyncio.to_thread(_shard_merge_sync, spool_id, keep_branch, caller_cwd)
+
+
+def _shard_abandon_sync(spool_id: str, keep_branch: bool = False, caller_cwd: str | None = None) -> str:
+    """Synchronous implementation of shard_abandon."""
     if not caller_cwd:
         return "Error: caller_cwd required. Pass your current working directory to prevent deleting a worktree you're inside of."
 
@@ -2824,13 +4024,8 @@ async def shard_abandon(spool_id: str, keep_branch: bool = False, caller_cwd: st
     if spool.get("status") == "running":
         pid = spool.get("pid")
         if pid:
-            try:
-                os.killpg(pid, signal.SIGTERM)
-            except (ProcessLookupError, OSError):
-                try:
-                    os.kill(pid, signal.SIGTERM)
-                except (ProcessLookupError, OSError):
-                    pass
+            _signal_process(pid, signal.SIGTERM)
+            _reap_pid(pid, timeout=0.5)
 
         spool["status"] = "error"
         spool["error"] = "Shard abandoned"
@@ -2840,14 +4035,38 @@ async def shard_abandon(spool_id: str, keep_branch: bool = False, caller_cwd: st
     success = _cleanup_shard(shard_info, str(main_repo), keep_branch=keep_branch, spool_id=spool_id)
 
     if success:
-        spool["shard"]["abandoned"] = True
-        spool["shard"]["abandoned_at"] = datetime.now().isoformat()
+        spool["shard"] = {**spool["shard"], "abandoned": True, "abandoned_at": datetime.now().isoformat()}
         _write_spool(spool_id, spool)
         return f"Abandoned shard {spool_id}" + (" (branch kept)" if keep_branch else "")
     else:
         return f"Warning: Shard cleanup may have been incomplete for {spool_id}"
 
 
+@mcp.tool()
+async def shard_abandon(spool_id: str, keep_branch: bool = False, caller_cwd: str | None = None) -> str:
+    """
+    Abandon a shard, removing the worktree without merging.
+
+    Use this when a shard's work is no longer needed.
+
+    Args:
+        spool_id: The spool_id with a shard to abandon
+        keep_branch: Keep the branch for later (default: delete)
+        caller_cwd: Optional current working directory of the caller. If provided
+            and the cwd is inside the worktree, the operation will be refused to
+            prevent breaking the caller's shell.
+
+    Returns:
+        Success or error message
+
+    Example:
+        shard_abandon("abc123")  # discard shard
+    """
+    import asyncio
+
+    return await asyncio.to_thread(_shard_abandon_sync, spool_id, keep_branch, caller_cwd)
+
+
 @mcp.tool()
 async def triage(worktree_path: str) -> str:
     """
@@ -2954,7 +4173,7 @@ async def spool_info(spool_id: str) -> str:
                 except IOError:
                     spool["_transcript_size"] = "error"
 
-    return json.dumps(spool, indent=2)
+    return _json_text(spool)
 
 
 # ============================================================================
@@ -2997,6 +4216,7 @@ def _codex_spin_sync(
     timeout: Optional[int],
     tags: Optional[str],
     env: Optional[Dict[str, str]],
+    wait: bool = False,
 ) -> str:
     """Synchronous implementation of codex_spin - runs Codex CLI in background."""
     # Require working_dir
@@ -3007,7 +4227,7 @@ def _codex_spin_sync(
     spool_id = "codex-" + str(uuid.uuid4())[:8]
 
     # Atomically check concurrency limit and create initial spool entry
-    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending")
+    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending", wait=wait)
     if not success:
         return error_msg
 
@@ -3033,7 +4253,7 @@ def _codex_spin_sync(
         codex_cmd.extend(["--sandbox", sandbox])
 
     # Parse tags
-    tag_list = [t.strip() for t in tags.split(",")] if tags else []
+    tag_list = _parse_tags(tags)
     tag_list.append("codex")  # Auto-tag as codex spool
 
     # Create spool record
@@ -3056,21 +4276,8 @@ def _codex_spin_sync(
         "harness": "codex",  # Mark as codex harness
     }
 
-    _write_spool(spool_id, spool)
-
-    # Spawn detached process
-    pid = _spawn_detached(spool_id, codex_cmd, working_dir, env)
-
-    # Update spool with PID and status
-    spool["pid"] = pid
-    spool["status"] = "running"
-    _write_spool(spool_id, spool)
-
-    # Start background monitor thread
-    monitor = threading.Thread(target=_monitor_spool, args=(spool_id,), daemon=True)
-    monitor.start()
-
-    return spool_id
+    # Spawn, record as running and monitor (single write)
+    return _start_spool(spool, codex_cmd, working_dir, env)
 
 
 def _codex_unspool_sync(spool_id: str) -> str:
@@ -3099,13 +4306,13 @@ def _codex_unspool_sync(spool_id: str) -> str:
         return f"Spool {spool_id} failed: {spool.get('error', 'Unknown error')}"
 
 
-def _codex_respin_sync(session_id: str, prompt: str) -> str:
+def _codex_respin_sync(session_id: str, prompt: str, wait: bool = False) -> str:
     """Synchronous implementation of codex_respin - continue a Codex session."""
     # Generate spool ID
     spool_id = "codex-" + str(uuid.uuid4())[:8]
 
     # Atomically check concurrency limit and create initial spool entry
-    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending")
+    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending", wait=wait)
     if not success:
         return error_msg
 
@@ -3148,21 +4355,8 @@ def _codex_respin_sync(session_id: str, prompt: str) -> str:
         "harness": "codex",
     }
 
-    _write_spool(spool_id, spool)
-
-    # Spawn detached process
-    pid = _spawn_detached(spool_id, codex_cmd, working_dir, env)
-
-    # Update spool with PID and status
-    spool["pid"] = pid
-    spool["status"] = "running"
-    _write_spool(spool_id, spool)
-
-    # Start background monitor
-    monitor = threading.Thread(target=_monitor_spool, args=(spool_id,), daemon=True)
-    monitor.start()
-
-    return spool_id
+    # Spawn, record as running and monitor (single write)
+    return _start_spool(spool, codex_cmd, working_dir, env)
 
 
 # ============================================================================
@@ -3203,6 +4397,7 @@ def _gemini_spin_sync(
     timeout: Optional[int],
     tags: Optional[str],
     env: Optional[Dict[str, str]],
+    wait: bool = False,
 ) -> str:
     """Synchronous implementation of gemini_spin - runs Gemini API in background subprocess."""
     # Require working_dir
@@ -3220,7 +4415,7 @@ def _gemini_spin_sync(
     spool_id = "gemini-" + str(uuid.uuid4())[:8]
 
     # Atomically check concurrency limit and create initial spool entry
-    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending")
+    success, error_msg = _try_reserve_slot_and_create(spool_id, initial_status="pending", wait=wait)
     if not success:
         return error_msg
 
@@ -3232,7 +4427,7 @@ def _gemini_spin_sync(
         resolved_model = GEMINI_DEFAULT_MODEL
 
     # Parse tags
-    tag_list = [t.strip() for t in tags.split(",")] if tags else []
+    tag_list = _parse_tags(tags)
     tag_list.append("gemini")  # Auto-tag as gemini spool
 
     # Create spool record
@@ -3255,8 +4450,6 @@ def _gemini_spin_sync(
         "harness": "gemini",
     }
 
-    _write_spool(spool_id, spool)
-
     # Build the Python script to run Gemini API
     # We use a subprocess with inline Python to avoid import issues if google-genai isn't installed
     gemini_script = f'''
@@ -3328,52 +4521,20 @@ except Exception as e:
     if api_key and "GOOGLE_API_KEY" not in process_env and "GEMINI_API_KEY" not in process_env:
         process_env["GOOGLE_API_KEY"] = api_key
 
-    # Spawn detached process
-    pid = _spawn_detached(spool_id, python_cmd, working_dir, process_env)
-
-    # Update spool with PID and status
-    spool["pid"] = pid
-    spool["status"] = "running"
+    # Spawn, record as running and monitor (single write)
     spool["script_path"] = str(script_path)
-    _write_spool(spool_id, spool)
-
-    # Start background monitor thread
-    monitor = threading.Thread(target=_monitor_gemini_spool, args=(spool_id,), daemon=True)
-    monitor.start()
-
-    return spool_id
+    return _start_spool(spool, python_cmd, working_dir, process_env, _poll_gemini_spool)
 
 
-def _monitor_gemini_spool(spool_id: str) -> None:
-    """Background thread that monitors a Gemini spool until completion."""
-    while True:
-        # Check for timeout
-        spool = _read_spool(spool_id)
-        if spool and spool.get("timeout"):
-            created = datetime.fromisoformat(spool["created_at"])
-            elapsed = (datetime.now() - created).total_seconds()
-            if elapsed > spool["timeout"]:
-                # Kill the process
-                pid = spool.get("pid")
-                if pid and _is_pid_alive(pid):
-                    try:
-                        os.kill(pid, signal.SIGTERM)
-                        time.sleep(0.5)
-                        if _is_pid_alive(pid):
-                            os.kill(pid, signal.SIGKILL)
-                    except ProcessLookupError:
-                        pass
-                # Mark as timeout
-                spool["status"] = "timeout"
-                spool["error"] = f'Timeout after {spool["timeout"]}s'
-                spool["completed_at"] = datetime.now().isoformat()
-                _write_spool(spool_id, spool)
-                _cleanup_gemini_script(spool_id)
-                break
+def _poll_gemini_spool(spool_id: str) -> bool:
+    """Run one monitoring pass over a Gemini spool. Returns True when done."""
+    # Check for timeout
+    spool = _read_spool(spool_id)
+    if _enforce_timeout(spool_id, spool):
+        _cleanup_gemini_script(spool_id)
+        return True
 
-        if _check_and_finalize_gemini_spool(spool_id):
-            break
-        time.sleep(MONITOR_POLL_INTERVAL)
+    return _check_and_finalize_gemini_spool(spool_id)
 
 
 def _check_and_finalize_gemini_spool(spool_id: str) -> bool:
@@ -3397,29 +4558,21 @@ def _check_and_finalize_gemini_spool(spool_id: str) -> bool:
         if _is_pid_alive(pid):
             return False
 
+        exit_code = _reap_pid(pid)
+        if exit_code is not None:
+            spool["exit_code"] = exit_code
+
         # Process finished - read output
         stdout_path = _get_output_path(spool_id)
         stderr_path = _get_stderr_path(spool_id)
 
-        stdout = ""
-        stderr = ""
-
-        if stdout_path.exists():
-            try:
-                stdout = stdout_path.read_text()
-            except IOError:
-                pass
-
-        if stderr_path.exists():
-            try:
-                stderr = stderr_path.read_text()
-            except IOError:
-                pass
+        stdout = _read_text(stdout_path)
+        stderr = _read_text(stderr_path)
 
         # Parse Gemini output (JSON format)
         try:
             if stdout.strip():
-                data = json.loads(stdout)
+                data = _json_loads(stdout)
                 if "error" in data:
                     spool["status"] = "error"
                     spool["error"] = data["error"]
@@ -3433,7 +4586,7 @@ def _check_and_finalize_gemini_spool(spool_id: str) -> bool:
                 spool["error"] = stderr[:500]
             else:
                 spool["status"] = "error"
-                spool["error"] = "Process exited with no output"
+                spool["error"] = _no_output_error(spool)
         except json.JSONDecodeError:
             if stdout.strip():
                 spool["result"] = stdout
@@ -3446,10 +4599,8 @@ def _check_and_finalize_gemini_spool(spool_id: str) -> bool:
         _write_spool(spool_id, spool)
 
         # Clean up files
-        if stdout_path.exists():
-            stdout_path.unlink()
-        if stderr_path.exists():
-            stderr_path.unlink()
+        stdout_path.unlink(missing_ok=True)
+        stderr_path.unlink(missing_ok=True)
         _cleanup_gemini_script(spool_id)
 
         return True
@@ -3457,12 +4608,10 @@ def _check_and_finalize_gemini_spool(spool_id: str) -> bool:
 
 def _cleanup_gemini_script(spool_id: str) -> None:
     """Clean up the temporary Python script for a Gemini spool."""
-    script_path = SPINDLE_DIR / f"{spool_id}.py"
-    if script_path.exists():
-        try:
-            script_path.unlink()
-        except IOError:
-            pass
+    try:
+        (SPINDLE_DIR / f"{spool_id}.py").unlink(missing_ok=True)
+    except IOError:
+        pass
 
 
 def _gemini_unspool_sync(spool_id: str) -> str:
@@ -3,6 +3,7 @@
 import json
 import multiprocessing
 import os
+import signal
 import subprocess
 import tempfile
 import threading
@@ -142,6 +143,123 @@ class TestSpoolStorage:
             _write_spool("test", {"id": "test"})
             assert spindle_dir.exists()
 
+    def test_list_spools_sees_external_changes(self, tmp_path):
+        """Cached listing should pick up rewrites and deletions made on disk."""
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("a", {"id": "a", "status": "running"})
+            _write_spool("b", {"id": "b", "status": "running"})
+            assert {s["id"] for s in _list_spools()} == {"a", "b"}
+
+            # Simulate another process rewriting and deleting spool files
+            tmp = tmp_path / "a.tmp"
+            tmp.write_text(json.dumps({"id": "a", "status": "complete"}))
+            os.rename(tmp, tmp_path / "a.json")
+            (tmp_path / "b.json").unlink()
+
+            spools = _list_spools()
+            assert [s["id"] for s in spools] == ["a"]
+            assert spools[0]["status"] == "complete"
+
+    def test_write_spool_populates_index(self, tmp_path):
+        """A written spool should be listed without reading its file back."""
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            data = {"id": "w", "status": "running"}
+            _write_spool("w", data)
+            data["status"] = "mutated"
+
+            with patch("spindle._json_loads", side_effect=AssertionError("re-read")):
+                spools = _list_spools()
+            assert spools == [{"id": "w", "status": "running"}]
+
+    def test_read_spool_serves_unchanged_file_from_index(self, tmp_path):
+        """Re-reading an unchanged spool should not parse it again."""
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("r", {"id": "r", "status": "running"})
+            with patch("spindle._json_loads", side_effect=AssertionError("re-parsed")):
+                spool = _read_spool("r")
+                spool["status"] = "mutated"
+                assert _read_spool("r") == {"id": "r", "status": "running"}
+
+            # A rewrite by another process replaces the file and is picked up
+            tmp = tmp_path / "r.tmp"
+            tmp.write_text(json.dumps({"id": "r", "status": "complete"}))
+            os.rename(tmp, tmp_path / "r.json")
+            assert _read_spool("r")["status"] == "complete"
+
+    def test_write_updates_index_in_place(self, tmp_path):
+        """Writes should update the index dict in place, leaving snapshots alone."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("a", {"id": "a", "status": "running"})
+            snapshot = spindle._refresh_spool_index()
+            index = spindle._SPOOL_INDEX[str(tmp_path)]
+
+            _write_spool("b", {"id": "b", "status": "running"})
+            assert spindle._SPOOL_INDEX[str(tmp_path)] is index
+            assert set(index) == {"a", "b"}
+            assert set(snapshot) == {"a"}
+
+    def test_list_spools_skips_scan_for_unchanged_directory(self, tmp_path):
+        """An old, unchanged directory mtime should let listing skip scandir."""
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("a", {"id": "a", "status": "running"})
+            old = time.time() - 60
+            os.utime(tmp_path, (old, old))
+            assert [s["id"] for s in _list_spools()] == ["a"]
+
+            with patch("spindle.os.scandir", side_effect=AssertionError("scanned")):
+                assert [s["id"] for s in _list_spools()] == ["a"]
+
+            # A rename into the directory moves its mtime and forces a rescan
+            _write_spool("b", {"id": "b", "status": "running"})
+            assert {s["id"] for s in _list_spools()} == {"a", "b"}
+
+    def test_cold_index_load_reads_files_in_parallel(self, tmp_path):
+        """Many unindexed files should load on the pool, skipping bad ones."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path), patch("spindle._INDEX_PARALLEL_MIN", 2):
+            for i in range(5):
+                (tmp_path / f"s{i}.json").write_text(json.dumps({"id": f"s{i}", "status": "complete"}))
+            (tmp_path / "bad.json").write_text("{not json")
+
+            with patch.object(spindle._INDEX_READ_POOL, "map", wraps=spindle._INDEX_READ_POOL.map) as pool_map:
+                ids = {s["id"] for s in _list_spools()}
+
+            assert ids == {f"s{i}" for i in range(5)}
+            pool_map.assert_called_once()
+
+    def test_cleanup_removes_only_expired_spools(self, tmp_path):
+        """Cleanup should delete spools older than 24h along with their output."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            old = (datetime.now() - timedelta(hours=25)).isoformat()
+            _write_spool("old", {"id": "old", "status": "complete", "created_at": old})
+            _write_spool("new", {"id": "new", "status": "complete", "created_at": datetime.now().isoformat()})
+            (tmp_path / "old.stdout").write_text("output")
+
+            spindle._cleanup_old_spools()
+
+            assert not (tmp_path / "old.json").exists()
+            assert not (tmp_path / "old.stdout").exists()
+            assert [s["id"] for s in _list_spools()] == ["new"]
+
+    def test_cleanup_removes_stale_file_without_parsing(self, tmp_path):
+        """A spool file untouched for over 24h should go even if unreadable."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            corrupt = tmp_path / "corrupt.json"
+            corrupt.write_text("{not json")
+            old = time.time() - 25 * 3600
+            os.utime(corrupt, (old, old))
+
+            spindle._cleanup_old_spools()
+
+            assert not corrupt.exists()
+
 
 class TestProcessUtils:
     """Test process utility functions."""
@@ -157,6 +275,128 @@ class TestProcessUtils:
         # Use a very high PID that's unlikely to exist
         assert _is_pid_alive(999999999) is False
 
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_exited_child_is_dead_and_reaped(self, tmp_path):
+        """An exited, unreaped child should report dead and yield its exit code."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached("exit3", ["sh", "-c", "exit 3"], str(tmp_path))
+
+        deadline = time.time() + 5
+        while _is_pid_alive(pid) and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert _is_pid_alive(pid) is False
+        assert spindle._reap_pid(pid) == 3
+        assert pid not in spindle._PIDFDS
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_signal_process_terminates_spawned_child(self, tmp_path):
+        """Signalling via the pidfd should terminate the child's process group."""
+        import signal
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached("sleeper", ["sleep", "30"], str(tmp_path))
+
+        spindle._signal_process(pid, signal.SIGTERM)
+
+        deadline = time.time() + 5
+        while _is_pid_alive(pid) and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert spindle._reap_pid(pid) == -signal.SIGTERM
+
+    def test_drop_unknown_spool_leaves_no_lock_file(self, tmp_path):
+        """Dropping a nonexistent spool should not create any files."""
+        import spindle
+
+        spindle_dir = tmp_path / "spindle"
+        spindle_dir.mkdir()
+        with patch("spindle.SPINDLE_DIR", spindle_dir):
+            assert spindle._spin_drop_sync("nope") == "Error: Unknown spool_id 'nope'"
+            assert spindle._spin_drop_sync("../escaped").startswith("Error: Unknown spool_id")
+        assert list(tmp_path.rglob("*.lock")) == []
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_dropped_spool_child_is_reaped(self, tmp_path):
+        """Dropping a live spool should reap its child and release the pidfd."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path), patch("spindle._monitor_spool"):
+            spool = {"id": "dropped", "status": "pending", "created_at": datetime.now().isoformat()}
+            spindle._start_spool(spool, ["sleep", "30"], str(tmp_path), None)
+            pid = spool["pid"]
+            pidfd = spindle._PIDFDS[pid]
+
+            assert spindle._spin_drop_sync("dropped") == "Dropped spool dropped"
+
+        assert pid not in spindle._CHILDREN
+        assert pid not in spindle._PIDFDS
+        assert not os.path.exists(f"/proc/{pid}")
+        try:
+            assert os.readlink(f"/proc/self/fd/{pidfd}") != "anon_inode:[pidfd]"
+        except OSError:
+            pass  # fd closed and not reused
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_lingering_child_reaped_once_it_exits(self, tmp_path):
+        """A child still running when reaped should be collected after it exits."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached("lingering", ["sleep", "0.3"], str(tmp_path))
+
+        assert spindle._reap_pid(pid) is None
+        assert pid in spindle._PIDFDS
+
+        deadline = time.time() + 5
+        while pid in spindle._PIDFDS and time.time() < deadline:
+            time.sleep(0.01)
+        assert pid not in spindle._PIDFDS
+        assert pid not in spindle._CHILDREN
+        assert not os.path.exists(f"/proc/{pid}")
+
+    def test_has_skein_outside_git_repo_skips_subprocess(self, tmp_path):
+        """Directories outside a git repo should not shell out to skein."""
+        import spindle
+
+        with patch("spindle.shutil.which", return_value="/usr/bin/skein"), \
+                patch("spindle.subprocess.run") as mock_run:
+            assert spindle._has_skein(str(tmp_path)) is False
+        mock_run.assert_not_called()
+
+    def test_bwrap_binds_cover_existing_paths_and_are_cached(self, tmp_path):
+        """Only existing paths should be bound; the answer is reused within the TTL."""
+        import spindle
+
+        present = tmp_path / "objects"
+        present.mkdir()
+        paths = (str(present), str(tmp_path / "missing"))
+        assert spindle._bwrap_binds(paths) == ("--bind", str(present), str(present))
+
+        present.rmdir()
+        assert spindle._bwrap_binds(paths) == ("--bind", str(present), str(present))
+        with patch("spindle._BWRAP_BINDS_TTL", 0):
+            assert spindle._bwrap_binds(paths) == ()
+
+    def test_has_skein_result_expires(self, tmp_path):
+        """A cached skein check should be reused, then redone after the TTL."""
+        import spindle
+
+        (tmp_path / ".git").mkdir()
+        healthy = MagicMock(returncode=0, stdout='{"healthy": true}')
+        with patch("spindle.shutil.which", return_value="/usr/bin/skein"), \
+                patch("spindle.subprocess.run", return_value=healthy) as mock_run:
+            assert spindle._has_skein(str(tmp_path)) is True
+            assert spindle._has_skein(str(tmp_path)) is True
+            assert mock_run.call_count == 1
+
+            with patch("spindle._SKEIN_CACHE_TTL", 0):
+                assert spindle._has_skein(str(tmp_path)) is True
+            assert mock_run.call_count == 2
+
 
 class TestSpoolDataStructure:
     """Test spool data structure and JSON serialization."""
@@ -433,6 +673,338 @@ class TestConcurrentFinalization:
 
             # Now without lock, it should work (though may error since no output)
             # The key is it doesn't block or corrupt
+
+    def test_finalize_skips_unchanged_partial_output(self, tmp_path):
+        """Unchanged partial stdout should not be re-read on the next poll."""
+        spool_id = "partial_test"
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool(spool_id, {
+                "id": spool_id,
+                "status": "running",
+                "pid": os.getpid(),  # Alive, so only stdout decides
+                "created_at": datetime.now().isoformat(),
+            })
+            stdout_path = tmp_path / f"{spool_id}.stdout"
+            stdout_path.write_text('{"result": "partial')
+
+            assert _check_and_finalize_spool(spool_id) is False
+            with patch("spindle.os.pread", side_effect=AssertionError("re-read")):
+                assert _check_and_finalize_spool(spool_id) is False
+
+            stdout_path.write_text('{"result": "done"}')
+            assert _check_and_finalize_spool(spool_id) is True
+            assert _read_spool(spool_id)["result"] == "done"
+
+    def test_timeout_does_not_overwrite_finished_spool(self, tmp_path):
+        """A spool finalized before the timeout pass should keep its result."""
+        import spindle
+
+        spool_id = "finished_test"
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            stale = {
+                "id": spool_id,
+                "status": "running",
+                "pid": 999999999,
+                "timeout": 1,
+                "created_at": (datetime.now() - timedelta(seconds=10)).isoformat(),
+            }
+            _write_spool(spool_id, {**stale, "status": "complete", "result": "done"})
+
+            assert spindle._enforce_timeout(spool_id, stale) is True
+            assert _read_spool(spool_id)["status"] == "complete"
+
+    def test_finalize_skips_decode_until_result_key_appears(self, tmp_path):
+        """Output without a result/error key should not be JSON-decoded."""
+        import spindle
+
+        spool_id = "nokey_test"
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool(spool_id, {
+                "id": spool_id,
+                "status": "running",
+                "pid": os.getpid(),
+                "created_at": datetime.now().isoformat(),
+            })
+            (tmp_path / f"{spool_id}.stdout").write_text('{"type": "progress", "text": "working')
+
+            real_loads = spindle._json_loads
+
+            def loads(data):
+                assert b"progress" not in bytes(data), "stdout decoded"
+                return real_loads(data)
+
+            with patch("spindle._json_loads", side_effect=loads):
+                assert _check_and_finalize_spool(spool_id) is False
+
+                # Nor once the key shows up, while the object is still open
+                with (tmp_path / f"{spool_id}.stdout").open("a") as f:
+                    f.write('", "result": "partial progress')
+                assert _check_and_finalize_spool(spool_id) is False
+
+    def test_finalize_reads_only_appended_output(self, tmp_path):
+        """Growing stdout should be read from where the last probe stopped."""
+        import spindle
+
+        spool_id = "append_test"
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool(spool_id, {
+                "id": spool_id,
+                "status": "running",
+                "pid": os.getpid(),
+                "created_at": datetime.now().isoformat(),
+            })
+            stdout_path = tmp_path / f"{spool_id}.stdout"
+            stdout_path.write_text('{"result": "do')
+            assert _check_and_finalize_spool(spool_id) is False
+
+            with stdout_path.open("a") as f:
+                f.write('ne"}')
+            offsets = []
+            real_pread = os.pread
+
+            def spy_pread(fd, n, offset):
+                offsets.append(offset)
+                return real_pread(fd, n, offset)
+
+            with patch("spindle.os.pread", side_effect=spy_pread):
+                assert _check_and_finalize_spool(spool_id) is True
+            assert offsets == [len('{"result": "do')]
+            assert _read_spool(spool_id)["result"] == "done"
+            assert str(stdout_path) not in spindle._STDOUT_TAILS
+
+    def test_codex_probe_survives_line_cut_mid_character(self, tmp_path):
+        """A partial codex line ending mid-character should read as incomplete."""
+        import spindle
+
+        spool_id = "codex_utf8"
+        with patch("spindle.SPINDLE_DIR", tmp_path), patch("spindle.orjson", None):
+            _write_spool(spool_id, {
+                "id": spool_id,
+                "status": "running",
+                "harness": "codex",
+                "pid": os.getpid(),
+                "created_at": datetime.now().isoformat(),
+            })
+            stdout_path = tmp_path / f"{spool_id}.stdout"
+            stdout_path.write_bytes('{"type": "item", "text": "✓"}\n'.encode()[:-4])
+            assert _check_and_finalize_spool(spool_id) is False
+
+            stdout_path.write_bytes('{"type": "item", "text": "✓"}\n{"type": "turn.completed"}\n'.encode())
+            assert _check_and_finalize_spool(spool_id) is True
+            assert _read_spool(spool_id)["status"] == "complete"
+
+    def test_probe_does_not_hold_output_in_memory(self, tmp_path):
+        """Probing a long-running spool should keep only a small carry-over."""
+        import spindle
+
+        spool_id = "long_codex"
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool(spool_id, {
+                "id": spool_id,
+                "status": "running",
+                "harness": "codex",
+                "pid": os.getpid(),
+                "created_at": datetime.now().isoformat(),
+            })
+            stdout_path = tmp_path / f"{spool_id}.stdout"
+            output = '{"type": "item.completed", "text": "%s"}\n' % ("x" * 1000)
+            stdout_path.write_text(output * 1000 + '{"type": "turn.')
+            assert _check_and_finalize_spool(spool_id) is False
+
+            state = spindle._STDOUT_TAILS[str(stdout_path)]
+            assert sum(len(v) for v in state.values() if isinstance(v, bytes)) < 1024
+
+            with stdout_path.open("a") as f:
+                f.write('completed"}\n')
+            assert _check_and_finalize_spool(spool_id) is True
+            assert _read_spool(spool_id)["result"].startswith(output * 1000)
+
+    def test_recover_orphans_finalizes_every_running_spool(self, tmp_path):
+        """Startup recovery should finalize all completed running spools."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            for i in range(4):
+                _write_spool(f"orphan{i}", {
+                    "id": f"orphan{i}",
+                    "status": "running",
+                    "pid": os.getpid(),
+                    "created_at": datetime.now().isoformat(),
+                })
+                (tmp_path / f"orphan{i}.stdout").write_text(json.dumps({"result": f"done {i}"}))
+
+            spindle._recover_orphans()
+
+            for i in range(4):
+                spool = _read_spool(f"orphan{i}")
+                assert spool["status"] == "complete"
+                assert spool["result"] == f"done {i}"
+
+    def test_session_expired_found_across_appends(self, tmp_path):
+        """The expired-session message should be found even when split over two reads."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            stderr_path = tmp_path / "expiry.stderr"
+            stderr_path.write_text("warming up\nNo conversation fo")
+            assert spindle._stderr_has_session_expired("expiry") is False
+
+            with stderr_path.open("a") as f:
+                f.write("und with session ID abc\n")
+            assert spindle._stderr_has_session_expired("expiry") is True
+
+            # A respawn truncates stderr; the old verdict shouldn't stick
+            stderr_path.write_text("ok\n")
+            assert spindle._stderr_has_session_expired("expiry") is False
+            spindle._STDERR_SCANS.pop(str(stderr_path), None)
+
+
+class TestMonitorSupervisor:
+    """Test the shared spool supervisor thread."""
+
+    def test_single_thread_polls_all_spools(self):
+        """All monitored spools should be polled by one supervisor thread."""
+        import spindle
+
+        polled = {}
+        done = threading.Event()
+
+        def fake_poll(spool_id):
+            polled.setdefault(spool_id, set()).add(threading.current_thread().name)
+            if len(polled) == 3:
+                done.set()
+            return True
+
+        with patch("spindle.MONITOR_POLL_INTERVAL", 0.05):
+            for spool_id in ("sup-a", "sup-b", "sup-c"):
+                spindle._monitor_spool(spool_id, fake_poll)
+
+            assert done.wait(timeout=5)
+        assert set().union(*polled.values()) == {"spindle-supervisor"}
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_terminate_returns_once_child_exits(self, tmp_path):
+        """A child that stops on SIGTERM shouldn't be waited on for the full grace."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached("term", ["sleep", "30"], str(tmp_path))
+
+        started = time.monotonic()
+        spindle._terminate_process(pid, grace=10)
+        assert time.monotonic() - started < 5
+        assert not _is_pid_alive(pid)
+        assert spindle._reap_pid(pid) == -signal.SIGTERM
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_child_exit_wakes_supervisor(self, tmp_path):
+        """A spawned child's exit should be checked without waiting an interval."""
+        import spindle
+
+        done = threading.Event()
+
+        def fake_poll(spool_id):
+            done.set()
+            spindle._reap_pid(pid)
+            return True
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached("quick", ["sh", "-c", "exit 0"], str(tmp_path))
+
+        with patch("spindle.MONITOR_POLL_INTERVAL", 60):
+            spindle._monitor_spool("quick", fake_poll, pid)
+            assert done.wait(timeout=5)
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_spin_wait_returns_on_child_exit(self, tmp_path):
+        """spin_wait should not sit out its poll interval once a child exits."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached(
+                "waited", ["sh", "-c", "sleep 0.3; printf '{\"result\": \"ok\"}'"], str(tmp_path)
+            )
+            _write_spool("waited", {
+                "id": "waited",
+                "status": "running",
+                "pid": pid,
+                "created_at": datetime.now().isoformat(),
+            })
+
+            start = time.monotonic()
+            assert spindle._spin_wait_sync("waited", mode="yield", timeout=30) == "ok"
+            assert time.monotonic() - start < 2
+
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd is Linux-only")
+    def test_async_spin_wait_returns_on_child_exit(self, tmp_path):
+        """The spin_wait tool should wake from the event loop on child exit."""
+        import asyncio
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            pid = spindle._spawn_detached(
+                "awaited", ["sh", "-c", "sleep 0.3; printf '{\"result\": \"ok\"}'"], str(tmp_path)
+            )
+            _write_spool("awaited", {
+                "id": "awaited",
+                "status": "running",
+                "pid": pid,
+                "created_at": datetime.now().isoformat(),
+            })
+
+            start = time.monotonic()
+            result = asyncio.run(spindle.spin_wait("awaited", mode="gather", timeout=30))
+            assert json.loads(result) == {"awaited": "ok"}
+            assert time.monotonic() - start < 2
+
+    def test_async_spin_wait_wakes_on_finalize_in_process(self, tmp_path):
+        """A spool finished by another thread should wake spin_wait without a PID to watch."""
+        import asyncio
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("finished", {
+                "id": "finished",
+                "status": "running",
+                "created_at": datetime.now().isoformat(),
+            })
+
+            def finish():
+                time.sleep(0.3)
+                _write_spool("finished", {"id": "finished", "status": "complete", "result": "ok"})
+
+            with patch("spindle._check_and_finalize_spool"):
+                threading.Thread(target=finish).start()
+                start = time.monotonic()
+                result = asyncio.run(spindle.spin_wait("finished", mode="yield", timeout=30))
+            assert result == "ok"
+            assert time.monotonic() - start < 2
+            assert not spindle._SPOOL_DONE_LISTENERS
+
+    def test_async_gather_rechecks_only_finished_spools(self, tmp_path):
+        """A spool finishing should not make gather mode re-read the others."""
+        import asyncio
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            for spool_id in ("first", "second"):
+                _write_spool(spool_id, {"id": spool_id, "status": "running"})
+
+            def finish():
+                for spool_id in ("first", "second"):
+                    time.sleep(0.3)
+                    _write_spool(spool_id, {"id": spool_id, "status": "complete", "result": spool_id})
+
+            with patch("spindle._check_and_finalize_spool") as check:
+                threading.Thread(target=finish).start()
+                result = asyncio.run(spindle.spin_wait("first,second", mode="gather", timeout=30))
+
+        assert json.loads(result) == {"first": "first", "second": "second"}
+        checked = [c.args[0] for c in check.call_args_list]
+        assert sorted(checked[:2]) == ["first", "second"]
+        assert checked[2:] == ["first", "second"]
+
+
 class TestConcurrencyLimit:
     """Test that concurrency limit is enforced atomically."""
 
@@ -461,6 +1033,39 @@ class TestConcurrencyLimit:
                 spool_file = tmp_path / "test123.json"
                 assert not spool_file.exists()
 
+    def test_try_reserve_slot_waits_for_free_slot(self, tmp_path):
+        """With wait=True, reservation should block until a slot is released."""
+        with patch("spindle.SPINDLE_DIR", tmp_path), patch("spindle.MAX_CONCURRENT", 1):
+            assert _try_reserve_slot_and_create("first", initial_status="running")[0] is True
+
+            outcome = {}
+            waiter = threading.Thread(
+                target=lambda: outcome.update(result=_try_reserve_slot_and_create("second", wait=True))
+            )
+            waiter.start()
+            time.sleep(0.2)
+            assert waiter.is_alive()  # Still blocked at the limit
+
+            _write_spool("first", {"id": "first", "status": "complete"})
+            waiter.join(timeout=1)
+
+            assert not waiter.is_alive()
+            assert outcome["result"] == (True, None)
+
+    def test_failed_spawn_releases_slot(self, tmp_path):
+        """A spool whose process can't be started should be recorded as an error."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            assert _try_reserve_slot_and_create("nospawn")[0] is True
+            spool = {"id": "nospawn", "status": "pending", "pid": None}
+
+            result = spindle._start_spool(spool, ["/nonexistent/agent-binary"], str(tmp_path), None)
+
+            assert result.startswith("Error:")
+            assert _read_spool("nospawn")["status"] == "error"
+            assert _count_running() == 0
+
     def test_concurrent_reservation_respects_limit(self, tmp_path):
         """
         Regression test for TOCTOU race condition (brief-20251229-79ly).
@@ -660,6 +1265,250 @@ class TestShardCleanup:
         # Should not raise exception even without spool_id
         success = _cleanup_shard(shard_info, "/tmp/repo")
         assert success is True
+
+    def test_merge_reports_worktree_removal_failure(self, tmp_path):
+        """shard_merge should tell the caller when the worktree couldn't be removed."""
+        import spindle
+
+        worktree = tmp_path / "repo" / "worktrees" / "wt"
+        worktree.mkdir(parents=True)
+
+        def fake_run(cmd, **kwargs):
+            failed = "worktree" in cmd and "remove" in cmd
+            return subprocess.CompletedProcess(cmd, 1 if failed else 0, "", "locked" if failed else "")
+
+        with patch("spindle.SPINDLE_DIR", tmp_path), \
+             patch("spindle.subprocess.run", side_effect=fake_run), \
+             patch("spindle._close_tender_folios", return_value=None), \
+             patch("spindle._CLEANUP_POOL") as pool:
+            _write_spool("merged", {
+                "id": "merged",
+                "status": "complete",
+                "shard": {"worktree_path": str(worktree), "branch_name": "shard-wt"},
+            })
+            result = spindle._shard_merge_sync("merged", caller_cwd=str(tmp_path))
+
+        assert "failed to remove worktree" in result
+        pool.submit.assert_not_called()
+
+
+class TestDashboard:
+    """Test spool_dashboard shard reporting."""
+
+    def test_shard_git_status_checked_once_per_shard(self, tmp_path):
+        """A recent shard needing attention should only be inspected once."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            for spool_id in ("shard-a", "shard-b"):
+                _write_spool(spool_id, {
+                    "id": spool_id,
+                    "status": "complete",
+                    "prompt": "task",
+                    "created_at": datetime.now().isoformat(),
+                    "completed_at": datetime.now().isoformat(),
+                    "shard": {"worktree_path": str(tmp_path / spool_id)},
+                })
+
+            with patch("spindle._get_shard_commit_status", return_value="uncommitted") as status, \
+                 patch("spindle._get_shard_change_stats") as stats:
+                dashboard = json.loads(spindle._spool_dashboard_sync())
+
+        assert status.call_count == 2
+        stats.assert_not_called()
+        assert {r["commit_status"] for r in dashboard["recent_completions"]} == {"uncommitted"}
+        assert len(dashboard["needing_attention"]) == 2
+
+
+class TestGrepPrefilter:
+    """Test the literal prefilter used by spool_grep."""
+
+    def test_extracts_required_literals(self):
+        """Alternations and literal runs should yield casefolded literals."""
+        import spindle
+
+        assert spindle._grep_literals("Error|FAILED") == ("error", "failed")
+        assert spindle._grep_literals("friction-[0-9]+-[a-z]+") == ("friction-",)
+        # Optional branches or no literals at all disable the prefilter
+        assert spindle._grep_literals("foo|") is None
+        assert spindle._grep_literals("[a-z]+") is None
+
+    def test_prefilter_never_rejects_a_match(self):
+        """Anything re.IGNORECASE matches must pass the prefilter."""
+        import re
+        import spindle
+
+        for pattern, text in [("fail", "FA\u0131L"), ("sk", "\u017f\u212a"), ("error", "ERROR")]:
+            assert re.search(pattern, text, re.IGNORECASE)
+            folded = spindle._grep_fold(text)
+            assert any(lit in folded for lit in spindle._grep_literals(pattern))
+
+    def test_grep_matches_agrees_with_findall(self):
+        """Kept matches and counts should match re.findall's output."""
+        import re
+        import spindle
+
+        text = " ".join(f"id-{i % 15}x" for i in range(40))
+        for pattern in (r"id-\d+", r"id-(\d+)(y)?", r"(id)-(\d+)"):
+            regex = re.compile(pattern, re.IGNORECASE)
+            found = regex.findall(text)
+            assert spindle._grep_matches(regex, text) == (list(dict.fromkeys(found))[:10], len(found))
+
+    def test_folded_text_reused_across_greps(self, tmp_path):
+        """Unchanged spools should not be re-folded on the next grep."""
+        import asyncio
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("r", {"id": "r", "status": "complete", "prompt": "p", "result": {"out": "Error 42"}})
+            first = json.loads(asyncio.run(spindle.spool_grep(r"error \d+")))
+            with patch("spindle._grep_fold", side_effect=AssertionError("re-folded")):
+                second = json.loads(asyncio.run(spindle.spool_grep(r"error \d+")))
+        assert first == second
+        assert second[0]["matches"] == ["Error 42"]
+
+    def test_dict_results_searched_by_leaf(self, tmp_path):
+        """Dict results should match their values, not their JSON encoding."""
+        import asyncio
+        import spindle
+
+        result = {"summary": "line one\nline two", "files": ["a.py", "b.py"], "count": 3}
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("d", {"id": "d", "status": "complete", "prompt": "p", "result": result})
+            assert json.loads(asyncio.run(spindle.spool_grep(r"one\nline")))[0]["matches"] == ["one\nline"]
+            assert json.loads(asyncio.run(spindle.spool_grep(r"\w+\.py")))[0]["match_count"] == 2
+            assert asyncio.run(spindle.spool_grep(r'"summary"')).startswith("No results")
+
+    def test_backtracking_pattern_times_out(self, tmp_path):
+        """A catastrophic pattern should fail fast rather than hang the tool."""
+        import asyncio
+        import spindle
+
+        pytest.importorskip("regex")
+        with patch("spindle.SPINDLE_DIR", tmp_path), patch("spindle._GREP_TIMEOUT", 0.2):
+            _write_spool("slow", {"id": "slow", "status": "complete", "prompt": "p", "result": "a" * 40 + "!"})
+            started = time.monotonic()
+            result = asyncio.run(spindle.spool_grep(r"(a|aa)+$"))
+        assert "took longer than" in result
+        assert time.monotonic() - started < 5
+
+    def test_regex_only_syntax_not_prefiltered_away(self, tmp_path):
+        """Patterns the regex module reads differently from re must still match."""
+        import asyncio
+        import spindle
+
+        pytest.importorskip("regex")
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("posix", {"id": "posix", "status": "complete", "prompt": "p", "result": "got 1ab"})
+            result = asyncio.run(spindle.spool_grep(r"[[:digit:]]ab"))
+        assert [m["id"] for m in json.loads(result)] == ["posix"]
+
+
+class TestSpoolSearch:
+    """Test spool_search matching and snippets."""
+
+    def test_snippet_aligned_when_lowercasing_changes_length(self, tmp_path):
+        """Snippets should surround the match even if lower() grows the text."""
+        import asyncio
+        import spindle
+
+        prompt = "İ" * 40 + " needle " + "x" * 40
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("s1", {"id": "s1", "status": "complete", "prompt": prompt})
+            matches = json.loads(asyncio.run(spindle.spool_search("NEEDLE", field="prompt")))
+
+        assert [m["id"] for m in matches] == ["s1"]
+        snippet = matches[0]["prompt_match"]
+        assert snippet.index("needle") == len("...") + 30
+
+
+class TestSpoolPeek:
+    """Test spool_peek tailing of stdout."""
+
+    def test_tail_matches_readlines_across_blocks(self, tmp_path):
+        """Tailing from the end should give the same lines as readlines."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("peeked", {"id": "peeked", "status": "running"})
+            output = "".join(f"line {i}\n" for i in range(200)) + "partial"
+            spindle._get_output_path("peeked").write_text(output)
+
+            with patch("spindle._TAIL_BLOCK", 16):
+                result = spindle._spool_peek_sync("peeked", lines=3)
+
+        assert result == (
+            "[spool peeked - running - 201 total lines, showing last 3]\n"
+            "line 198\nline 199\npartial"
+        )
+
+    def test_tail_boundary_inside_multibyte_character(self, tmp_path):
+        """A block boundary splitting a UTF-8 character should not break decoding."""
+        import spindle
+
+        with patch("spindle.SPINDLE_DIR", tmp_path):
+            _write_spool("unicode", {"id": "unicode", "status": "running"})
+            # "✓" is three bytes; a 4-byte block ending here splits it
+            spindle._get_output_path("unicode").write_bytes("ab ✓\nlast\n".encode())
+
+            with patch("spindle._TAIL_BLOCK", 7):
+                result = spindle._spool_peek_sync("unicode", lines=1)
+
+        assert result == "[spool unicode - running - 2 total lines, showing last 1]\nlast\n"
+
+
+class TestTenderFolios:
+    """Test closing SKEIN tender folios after a merge."""
+
+    def test_closes_matching_tenders_over_one_connection(self):
+        """The folio query and every close should share a keep-alive connection."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import spindle
+
+        connections = []
+        posts = []
+        folios = [
+            {"folio_id": f"t{i}", "status": "open", "metadata": json.dumps({"worktree_name": "wt"})}
+            for i in range(3)
+        ] + [{"folio_id": "other", "status": "open", "metadata": {"worktree_name": "elsewhere"}}]
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                connections.append(self.client_address)
+
+            def reply(self, body):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self.reply(json.dumps(folios).encode())
+
+            def do_POST(self):
+                posts.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+                self.reply(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with patch("spindle._has_skein", return_value=True), \
+                    patch.dict(os.environ, {"SKEIN_URL": f"http://127.0.0.1:{server.server_port}"}):
+                message = spindle._close_tender_folios("wt", "/tmp")
+        finally:
+            server.shutdown()
+
+        assert message == "Closed tender(s): t0, t1, t2"
+        assert [p["from_id"] for p in posts] == ["t0", "t1", "t2"]
+        assert len(connections) == 1
+
+
 class TestWorktreeNameUniqueness:
     """Test that worktree names are unique even when created rapidly."""
 